@@ -12,6 +12,8 @@ from orca_backup.core.detector import detect_slicers, get_installed_slicers, get
 from orca_backup.core.restore import restore_backup
 from orca_backup.core.verify import get_backup_info, verify_backup
 from orca_backup.models.slicer import SlicerType
+from orca_backup.utils.compression import ARCHIVE_FORMATS, DEFAULT_COMPRESS_LEVEL
+from orca_backup.utils.hashing import HASH_ALGORITHMS
 from orca_backup.utils.paths import get_default_backup_dir
 
 app = typer.Typer(
@@ -59,6 +61,19 @@ def backup(
         None, "--output", "-o", help="Output directory for backups"
     ),
     compress: bool = typer.Option(True, "--compress/--no-compress", help="Compress backup to ZIP"),
+    compress_level: int = typer.Option(
+        DEFAULT_COMPRESS_LEVEL,
+        "--compress-level",
+        min=0,
+        max=9,
+        help="Compression level: 1 fastest, 3 default, 9 smallest",
+    ),
+    archive_format: str = typer.Option(
+        "zip", "--format", "-f", help="Archive format for compressed backups (zip or tar.zst)"
+    ),
+    hash_algorithm: str = typer.Option(
+        "sha256", "--hash", help="Checksum algorithm (sha256, or xxh3 for speed)"
+    ),
     verify: bool = typer.Option(
         True, "--verify/--no-verify", help="Verify backup after creation"
     ),
@@ -68,6 +83,18 @@ def backup(
     output_dir = output or get_default_backup_dir()
     output_dir = Path(output_dir)
 
+    archive_format = archive_format.lower()
+    if archive_format not in ARCHIVE_FORMATS:
+        console.print(f"[red]ERROR: Invalid format: {archive_format}[/red]")
+        console.print(f"Valid options: {', '.join(ARCHIVE_FORMATS)}")
+        raise typer.Exit(1)
+
+    hash_algorithm = hash_algorithm.lower()
+    if hash_algorithm not in HASH_ALGORITHMS:
+        console.print(f"[red]ERROR: Invalid hash algorithm: {hash_algorithm}[/red]")
+        console.print(f"Valid options: {', '.join(HASH_ALGORITHMS)}")
+        raise typer.Exit(1)
+
     # Determine which slicers to backup
     if slicer.lower() == "all":
         slicers_to_backup = get_installed_slicers()
@@ -96,7 +123,13 @@ def backup(
 
         try:
             backup_path = create_backup(
-                slicer_info, output_dir, compress=compress, verify=verify
+                slicer_info,
+                output_dir,
+                compress=compress,
+                verify=verify,
+                compress_level=compress_level,
+                archive_format=archive_format,
+                hash_algorithm=hash_algorithm,
             )
             console.print(f"[green]Backup created successfully![/green]")
             console.print(f"   Location: {backup_path}")
@@ -123,6 +156,9 @@ def restore(
     backup_existing: bool = typer.Option(
         True, "--backup-existing/--no-backup", help="Backup existing files before restore"
     ),
+    verify: bool = typer.Option(
+        True, "--verify/--no-verify", help="Verify backup before restoring"
+    ),
 ):
     """Restore a backup to a slicer installation."""
     if not backup_path.exists():
@@ -146,6 +182,7 @@ def restore(
             slicer_type=slicer_type,
             dry_run=dry_run,
             backup_existing=backup_existing,
+            skip_verify=not verify,
         )
 
         if dry_run:
@@ -179,13 +216,18 @@ def verify(backup_path: Path = typer.Argument(..., help="Path to backup file or
 
 
 @app.command()
-def info(backup_path: Path = typer.Argument(..., help="Path to backup file or directory")):
+def info(
+    backup_path: Path = typer.Argument(..., help="Path to backup file or directory"),
+    verify: bool = typer.Option(
+        False, "--verify", help="Verify checksums of every file (slower)"
+    ),
+):
     """Show information about a backup."""
     if not backup_path.exists():
         console.print(f"[red]ERROR: Backup not found: {backup_path}[/red]")
         raise typer.Exit(1)
 
-    backup_info = get_backup_info(backup_path)
+    backup_info = get_backup_info(backup_path, verify=verify)
     if not backup_info:
         console.print("[red]ERROR: Could not load backup information[/red]")
         raise typer.Exit(1)
@@ -204,7 +246,11 @@ def info(backup_path: Path = typer.Argument(..., help="Path to backup file or di
     table.add_row("Total Size", f"{manifest.size_mb:.2f} MB")
     table.add_row("Backup Size", f"{backup_info.size_mb:.2f} MB")
     table.add_row("Compressed", "Yes" if manifest.compressed else "No")
-    table.add_row("Valid", "Yes" if backup_info.is_valid else "No")
+    table.add_row("Checksum", manifest.hash_algorithm)
+    if backup_info.is_valid is None:
+        table.add_row("Valid", "Not checked (use --verify)")
+    else:
+        table.add_row("Valid", "Yes" if backup_info.is_valid else "No")
 
     console.print(table)
 
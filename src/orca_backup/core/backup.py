@@ -1,30 +1,62 @@
 """Backup creation functionality."""
 
-import hashlib
-import json
+import io
+import os
 import platform
 import shutil
-import tempfile
+import tarfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from orca_backup.models.backup import BackupManifest, FileEntry
 from orca_backup.models.slicer import SlicerInfo
-from orca_backup.utils.compression import compress_directory
-from orca_backup.utils.paths import ensure_directory, get_backup_name
+from orca_backup.utils.compression import (
+    ARCHIVE_FORMATS,
+    DEFAULT_COMPRESS_LEVEL,
+    ZSTD_SUFFIX,
+    add_file_to_tar,
+    add_files_to_zip,
+    append_zst_metadata,
+    create_zip,
+    create_zst_tar,
+    estimate_zip_size,
+)
+from orca_backup.utils.hashing import BUFFER_SIZE, HASH_ALGORITHMS, calculate_digest, new_hasher
+from orca_backup.utils.paths import ensure_directory, get_backup_name, iter_files
 
 
 def calculate_sha256(file_path: Path) -> str:
     """Calculate SHA256 checksum of a file."""
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+    return calculate_digest(file_path, "sha256")
 
 
-def copy_file_with_metadata(src: Path, dst: Path, base_path: Path) -> FileEntry:
+def copy_and_hash(src: Path, dst: Path, hash_algorithm: str = "sha256") -> str:
+    """
+    Copy a file and calculate its checksum in a single read pass.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+        hash_algorithm: Checksum algorithm, "sha256" or "xxh3" (default: "sha256")
+
+    Returns:
+        Checksum of the copied data
+    """
+    hasher = new_hasher(hash_algorithm)
+    with open(src, "rb") as src_f, open(dst, "wb") as dst_f:
+        for byte_block in iter(lambda: src_f.read(BUFFER_SIZE), b""):
+            hasher.update(byte_block)
+            dst_f.write(byte_block)
+    shutil.copystat(src, dst)
+    return hasher.hexdigest()
+
+
+def copy_file_with_metadata(
+    src: Path, dst: Path, base_path: Path, hash_algorithm: str = "sha256"
+) -> FileEntry:
     """
     Copy a file and create its metadata entry.
 
@@ -32,27 +64,66 @@ def copy_file_with_metadata(src: Path, dst: Path, base_path: Path) -> FileEntry:
         src: Source file path
         dst: Destination file path
         base_path: Base path for calculating relative paths
+        hash_algorithm: Checksum algorithm, "sha256" or "xxh3" (default: "sha256")
 
     Returns:
         FileEntry with file metadata
     """
     dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dst)
+    checksum = copy_and_hash(src, dst, hash_algorithm)
 
     relative_path = str(src.relative_to(base_path))
     size = src.stat().st_size
-    checksum = calculate_sha256(src)
 
     return FileEntry(path=relative_path, size=size, sha256=checksum)
 
 
-def create_backup_staging(slicer: SlicerInfo, staging_dir: Path) -> List[FileEntry]:
+def _stage_one(item: Tuple[Path, Path, str, int, str]) -> FileEntry:
+    """Copy and hash one file for the worker pool, reusing the size from the scan."""
+    src, dst, relative_path, size, hash_algorithm = item
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    checksum = copy_and_hash(src, dst, hash_algorithm)
+    return FileEntry(path=relative_path, size=size, sha256=checksum)
+
+
+def collect_backup_files(slicer: SlicerInfo) -> List[Tuple[Path, str, int]]:
+    """
+    Collect the files that belong in a backup.
+
+    Sizes come from the directory scan, so callers need not stat files again.
+
+    Args:
+        slicer: Slicer information
+
+    Returns:
+        List of (source path, relative path, size in bytes) tuples
+    """
+    files: List[Tuple[Path, str, int]] = []
+    base_path = slicer.config_path
+    prefix_len = len(os.path.join(os.fspath(base_path), ""))
+
+    for directory in (slicer.user_dir, slicer.custom_scripts_dir):
+        if directory and directory.exists():
+            directory.relative_to(base_path)  # Raises if the directory is outside config_path
+            # Relative paths are sliced off the scanned strings instead of Path.relative_to
+            for path, size in iter_files(directory):
+                files.append((Path(path), path[prefix_len:], size))
+
+    return files
+
+
+def create_backup_staging(
+    slicer: SlicerInfo, staging_dir: Path, hash_algorithm: str = "sha256"
+) -> List[FileEntry]:
     """
-    Create backup in a staging directory.
+    Copy a slicer configuration into a backup directory.
+
+    Each file is hashed while it is copied, so source data is only read once.
 
     Args:
         slicer: Slicer information
-        staging_dir: Temporary staging directory
+        staging_dir: Directory to copy the files into
+        hash_algorithm: Checksum algorithm, "sha256" or "xxh3" (default: "sha256")
 
     Returns:
         List of file entries
@@ -63,46 +134,34 @@ def create_backup_staging(slicer: SlicerInfo, staging_dir: Path) -> List[FileEnt
     # Copy main config file
     if slicer.conf_file:
         dst = staging_dir / slicer.conf_file.name
-        entry = copy_file_with_metadata(slicer.conf_file, dst, base_path)
+        entry = copy_file_with_metadata(slicer.conf_file, dst, base_path, hash_algorithm)
         file_entries.append(entry)
 
-    # Copy entire user directory
-    if slicer.user_dir:
-        user_dst = staging_dir / "user"
-        shutil.copytree(slicer.user_dir, user_dst, dirs_exist_ok=True)
-
-        # Create entries for all files in user directory
-        for file_path in slicer.user_dir.rglob("*"):
-            if file_path.is_file():
-                relative_path = str(file_path.relative_to(base_path))
-                size = file_path.stat().st_size
-                checksum = calculate_sha256(file_path)
-                file_entries.append(FileEntry(path=relative_path, size=size, sha256=checksum))
-
-    # Copy custom_scripts if it exists
-    if slicer.custom_scripts_dir and slicer.custom_scripts_dir.exists():
-        scripts_dst = staging_dir / "custom_scripts"
-        shutil.copytree(slicer.custom_scripts_dir, scripts_dst, dirs_exist_ok=True)
-
-        for file_path in slicer.custom_scripts_dir.rglob("*"):
-            if file_path.is_file():
-                relative_path = str(file_path.relative_to(base_path))
-                size = file_path.stat().st_size
-                checksum = calculate_sha256(file_path)
-                file_entries.append(FileEntry(path=relative_path, size=size, sha256=checksum))
+    # Copy and hash user directory and custom_scripts (if it exists) across all cores
+    files = [
+        (src, staging_dir / rel, rel, size, hash_algorithm)
+        for src, rel, size in collect_backup_files(slicer)
+    ]
+    if files:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            file_entries.extend(executor.map(_stage_one, files, chunksize=32))
 
     return file_entries
 
 
 def create_manifest(
-    slicer: SlicerInfo, file_entries: List[FileEntry], compressed: bool
+    slicer: SlicerInfo,
+    file_entries: List[FileEntry],
+    compressed: bool,
+    created_at: Optional[datetime] = None,
+    hash_algorithm: str = "sha256",
 ) -> BackupManifest:
     """Create backup manifest."""
     total_size = sum(entry.size for entry in file_entries)
 
     return BackupManifest(
         version="1.0",
-        created_at=datetime.now(),
+        created_at=created_at or datetime.now(),
         slicer=slicer.name,  # Already a string due to use_enum_values
         slicer_version=slicer.version,
         platform=platform.system().lower(),
@@ -110,23 +169,132 @@ def create_manifest(
         total_files=len(file_entries),
         total_size=total_size,
         compressed=compressed,
+        hash_algorithm=hash_algorithm,
     )
 
 
+def _manifest_json(manifest: BackupManifest) -> bytes:
+    """Serialize a manifest for backup_manifest.json (compact, via pydantic-core)."""
+    return manifest.model_dump_json().encode("utf-8")
+
+
+def _backup_sources(slicer: SlicerInfo) -> List[Tuple[Path, str, int]]:
+    """List (source path, relative path, size) for every file in a backup, conf file first."""
+    sources: List[Tuple[Path, str, int]] = []
+    if slicer.conf_file:
+        relative_path = str(slicer.conf_file.relative_to(slicer.config_path))
+        sources.append((slicer.conf_file, relative_path, slicer.conf_file.stat().st_size))
+    sources.extend(collect_backup_files(slicer))
+    return sources
+
+
+def write_zip_backup(
+    slicer: SlicerInfo,
+    output_path: Path,
+    created_at: datetime,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL,
+    hash_algorithm: str = "sha256",
+) -> BackupManifest:
+    """
+    Stream a slicer configuration straight into a ZIP backup.
+
+    Each file is hashed while it is compressed, so no staging copy is needed.
+
+    Args:
+        slicer: Slicer to backup
+        output_path: Output ZIP file path
+        created_at: Backup timestamp
+        compress_level: DEFLATE level from 0 to 9 (default: 3)
+        hash_algorithm: Checksum algorithm, "sha256" or "xxh3" (default: "sha256")
+
+    Returns:
+        Manifest written to the archive
+    """
+    sources = _backup_sources(slicer)
+    date_time = created_at.timetuple()[:6]
+    entries = []
+    for src, relative_path, file_size in sources:
+        zinfo = zipfile.ZipInfo(relative_path, date_time=date_time)
+        zinfo.file_size = file_size
+        entries.append((src, zinfo))
+
+    with create_zip(output_path, compress_level, estimate_zip_size(entries)) as zipf:
+        results = add_files_to_zip(zipf, entries, hash_algorithm)
+        file_entries = [
+            FileEntry(path=relative_path, size=size, sha256=checksum)
+            for (_src, relative_path, _file_size), (size, checksum) in zip(sources, results)
+        ]
+
+        manifest = create_manifest(slicer, file_entries, True, created_at, hash_algorithm)
+        zipf.writestr("backup_manifest.json", _manifest_json(manifest))
+
+    return manifest
+
+
+def write_zst_backup(
+    slicer: SlicerInfo,
+    output_path: Path,
+    created_at: datetime,
+    compress_level: int = 3,
+    hash_algorithm: str = "sha256",
+) -> BackupManifest:
+    """
+    Stream a slicer configuration straight into a tar.zst backup.
+
+    Each file is hashed while it is compressed, so no staging copy is needed.
+
+    Args:
+        slicer: Slicer to backup
+        output_path: Output .tar.zst file path
+        created_at: Backup timestamp
+        compress_level: Zstandard compression level (default: 3)
+        hash_algorithm: Checksum algorithm, "sha256" or "xxh3" (default: "sha256")
+
+    Returns:
+        Manifest written to the archive
+    """
+    file_entries: List[FileEntry] = []
+    with create_zst_tar(output_path, level=compress_level) as tar:
+        for src, relative_path, _file_size in _backup_sources(slicer):
+            hasher = new_hasher(hash_algorithm)
+            size = add_file_to_tar(tar, src, relative_path, hasher=hasher)
+            file_entries.append(FileEntry(path=relative_path, size=size, sha256=hasher.hexdigest()))
+
+        manifest = create_manifest(slicer, file_entries, True, created_at, hash_algorithm)
+        data = _manifest_json(manifest)
+        tarinfo = tarfile.TarInfo("backup_manifest.json")
+        tarinfo.size = len(data)
+        tarinfo.mtime = int(created_at.timestamp())
+        tar.addfile(tarinfo, io.BytesIO(data))
+
+    # A second copy after the stream lets load_manifest() skip decompression
+    append_zst_metadata(output_path, data)
+    return manifest
+
+
 def create_backup(
     slicer: SlicerInfo,
     output_dir: Path,
     compress: bool = True,
     verify: bool = True,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL,
+    archive_format: str = "zip",
+    hash_algorithm: str = "sha256",
 ) -> Path:
     """
     Create a backup of a slicer configuration.
 
+    Files are written straight to the output archive or directory; there is
+    no intermediate staging copy.
+
     Args:
         slicer: Slicer to backup
         output_dir: Directory to save backup
         compress: Whether to compress the backup (default: True)
         verify: Whether to verify the backup (default: True)
+        compress_level: Compression level from 0 to 9, higher is smaller (default: 3)
+        archive_format: Archive format when compressing, "zip" or "tar.zst" (default: "zip")
+        hash_algorithm: Checksum algorithm, "sha256" or "xxh3" (default: "sha256")
 
     Returns:
         Path to created backup file/directory
@@ -137,35 +305,44 @@ def create_backup(
     """
     if not slicer.is_valid():
         raise ValueError(f"Invalid slicer: {slicer.display_name} not properly installed")
+    if archive_format not in ARCHIVE_FORMATS:
+        raise ValueError(f"Invalid archive format: {archive_format}")
+    if hash_algorithm not in HASH_ALGORITHMS:
+        raise ValueError(f"Invalid hash algorithm: {hash_algorithm}")
 
     ensure_directory(output_dir)
 
-    # Create temporary staging directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        staging_dir = Path(temp_dir) / "backup"
-        staging_dir.mkdir()
-
-        # Copy files to staging and collect metadata
-        file_entries = create_backup_staging(slicer, staging_dir)
-
-        # Create manifest
-        manifest = create_manifest(slicer, file_entries, compress)
-
-        # Write manifest to staging directory
-        manifest_path = staging_dir / "backup_manifest.json"
-        with open(manifest_path, "w", encoding="utf-8") as f:
-            json.dump(manifest.model_dump(mode="json"), f, indent=2, default=str)
-
-        # Generate output filename
-        backup_name = get_backup_name(slicer.name, manifest.created_at, compress)  # name is already a string
-        output_path = output_dir / backup_name
-
-        if compress:
-            # Compress to ZIP
-            compress_directory(staging_dir, output_path)
+    # Generate output filename
+    created_at = datetime.now()
+    extension = ZSTD_SUFFIX if archive_format == "tar.zst" else ".zip"
+    backup_name = get_backup_name(slicer.name, created_at, compress, extension)  # name is already a string
+    output_path = output_dir / backup_name
+
+    if not compress:
+        # Created before the try so a name clash never removes an existing backup
+        output_path.mkdir()
+
+    try:
+        if compress and archive_format == "tar.zst":
+            write_zst_backup(slicer, output_path, created_at, compress_level, hash_algorithm)
+        elif compress:
+            write_zip_backup(slicer, output_path, created_at, compress_level, hash_algorithm)
         else:
-            # Copy directory
-            shutil.copytree(staging_dir, output_path)
+            # Copy files directly into the backup directory
+            file_entries = create_backup_staging(slicer, output_path, hash_algorithm)
+            manifest = create_manifest(slicer, file_entries, compress, created_at, hash_algorithm)
+            manifest_path = output_path / "backup_manifest.json"
+            manifest_path.write_bytes(_manifest_json(manifest))
+    except Exception as e:
+        # A name clash means output_path is an earlier backup the writers refused to open
+        if isinstance(e, FileExistsError) and Path(e.filename or "") == output_path:
+            raise
+        # Don't leave a partial backup behind
+        if output_path.is_dir():
+            shutil.rmtree(output_path, ignore_errors=True)
+        elif output_path.exists():
+            output_path.unlink()
+        raise
 
     if verify:
         from orca_backup.core.verify import verify_backup
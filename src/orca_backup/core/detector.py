@@ -3,14 +3,24 @@
 import json
 import platform
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from orca_backup.models.slicer import SlicerInfo, SlicerType
 
+# Version in a conf header like "OrcaSlicer 2.3.1-beta"
+_VERSION_RE = re.compile(r"(\d+\.\d+\.\d+(?:-\w+)?)")
 
+
+@lru_cache(maxsize=1)
 def get_slicer_paths() -> Dict[str, Dict[str, Path]]:
-    """Get platform-specific slicer config directory paths."""
+    """
+    Get platform-specific slicer config directory paths.
+
+    The result is cached for the life of the process; call
+    get_slicer_paths.cache_clear() if the home directory changes.
+    """
     system = platform.system().lower()
 
     if system == "windows":
@@ -57,10 +67,10 @@ def extract_version(conf_file: Path) -> Optional[str]:
             content = f.read()
             # Try to parse as JSON
             if content.strip().startswith("{"):
-                data = json.loads(content.split("# MD5")[0])  # Remove checksum line
+                data = json.loads(content.partition("# MD5")[0])  # Remove checksum line
                 if "header" in data:
                     # Extract version from header like "OrcaSlicer 2.3.1-beta"
-                    match = re.search(r"(\d+\.\d+\.\d+(?:-\w+)?)", data["header"])
+                    match = _VERSION_RE.search(data["header"])
                     if match:
                         return match.group(1)
                 if "app" in data and "version" in data["app"]:
@@ -1,38 +1,77 @@
 """Backup restore functionality."""
 
+import ntpath
+import os
 import shutil
-import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple
 
 from orca_backup.core.backup import create_backup
 from orca_backup.core.detector import get_slicer_info
 from orca_backup.core.verify import load_manifest, verify_backup
-from orca_backup.models.slicer import SlicerInfo, SlicerType
-from orca_backup.utils.compression import extract_archive
+from orca_backup.models.backup import BackupManifest
+from orca_backup.models.slicer import SlicerInfo, SlicerType, clear_validity_cache
+from orca_backup.utils.compression import (
+    is_archive,
+    is_zstd_archive,
+    open_zst_tar,
+    preallocate,
+    zstd_available,
+)
+from orca_backup.utils.hashing import BUFFER_SIZE
 
+# Bytes requested per copy_file_range call; the kernel copies what it can
+COPY_CHUNK_SIZE = 1 << 30
 
-def get_restore_file_list(backup_path: Path) -> List[Tuple[Path, Path]]:
+# Concurrent entry restores; zlib and file writes release the GIL
+RESTORE_WORKERS = 4
+
+
+def _is_safe_entry_path(path: str) -> bool:
+    """Check that a manifest path is relative and cannot climb out of the target directory."""
+    normalized = path.replace("\\", "/")
+    if not normalized or normalized.startswith("/") or ntpath.splitdrive(normalized)[0]:
+        return False
+    return ".." not in normalized.split("/")
+
+
+def get_restore_file_list(
+    backup_path: Path,
+    slicer: Optional[SlicerInfo] = None,
+    manifest: Optional[BackupManifest] = None,
+) -> List[Tuple[Path, Path]]:
     """
     Get list of files to restore and their destinations.
 
     Args:
         backup_path: Path to backup
+        slicer: Target slicer (looked up from the manifest if None)
+        manifest: Already-loaded manifest (loaded from backup_path if None)
 
     Returns:
         List of (source, destination) tuples
+
+    Raises:
+        ValueError: If the manifest cannot be loaded or lists a path that is
+            absolute, has a drive letter, or contains a ".." component
     """
-    manifest = load_manifest(backup_path)
+    if manifest is None:
+        manifest = load_manifest(backup_path)
     if not manifest:
         raise ValueError("Could not load backup manifest")
 
     # Determine slicer info
-    slicer_type = SlicerType(manifest.slicer)
-    slicer = get_slicer_info(slicer_type)
+    if slicer is None:
+        slicer = get_slicer_info(SlicerType(manifest.slicer))
 
     file_list = []
     for file_entry in manifest.files:
+        # Restores stream members to their manifest paths, so nothing else stops traversal
+        if not _is_safe_entry_path(file_entry.path):
+            raise ValueError(f"Unsafe path in backup manifest: {file_entry.path}")
         src = Path(file_entry.path)
         dst = slicer.config_path / file_entry.path
         file_list.append((src, dst))
@@ -40,11 +79,110 @@ def get_restore_file_list(backup_path: Path) -> List[Tuple[Path, Path]]:
     return file_list
 
 
+def _write_stream(src: BinaryIO, dst: Path, size: Optional[int] = None) -> None:
+    """
+    Write an open backup entry to its destination path.
+
+    Args:
+        src: Readable entry stream
+        dst: Destination file path
+        size: Expected size from the manifest, used to preallocate the file
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    with open(dst, "wb") as out:
+        if size:
+            preallocate(out.fileno(), size)
+        shutil.copyfileobj(src, out, BUFFER_SIZE)
+        out.truncate()
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """
+    Copy a file with its metadata, in-kernel via copy_file_range where available.
+
+    Falls back to shutil.copy2 if the syscall is missing or refused (for
+    example across filesystems on older kernels), or if it copies nothing
+    from a non-empty file, which some filesystems report instead of an error.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), COPY_CHUNK_SIZE)
+                supported = copied > 0 or os.fstat(fsrc.fileno()).st_size == 0
+                while copied:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), COPY_CHUNK_SIZE)
+            if supported:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
+def _restore_one(
+    copy_entry: Callable[[Path, Path], None], src_rel: Path, dst: Path
+) -> Optional[str]:
+    """Restore one file, returning a warning message on failure."""
+    try:
+        copy_entry(src_rel, dst)
+    except (FileNotFoundError, KeyError):
+        return f"File not found in backup: {src_rel}"
+    except Exception as e:
+        return f"Failed to restore {src_rel}: {e}"
+    return None
+
+
+def _restore_files(
+    file_list: List[Tuple[Path, Path]], copy_entry: Callable[[Path, Path], None]
+) -> int:
+    """
+    Restore files concurrently, streaming each entry straight to its destination.
+
+    Args:
+        file_list: (source, destination) tuples from get_restore_file_list
+        copy_entry: Callable that copies one backup entry to a destination path
+
+    Returns:
+        Number of files restored
+    """
+    with ThreadPoolExecutor(max_workers=RESTORE_WORKERS) as executor:
+        warnings = list(executor.map(lambda item: _restore_one(copy_entry, *item), file_list))
+
+    for warning in warnings:
+        if warning:
+            print(f"WARNING: {warning}")
+    return warnings.count(None)
+
+
+def _restore_zst_files(
+    backup_path: Path, file_list: List[Tuple[Path, Path]], sizes: Dict[Path, int]
+) -> int:
+    """Restore files in a single sequential pass over a tar.zst stream."""
+    pending = {src_rel.as_posix(): (src_rel, dst) for src_rel, dst in file_list}
+    restored_count = 0
+    with open_zst_tar(backup_path) as tar:
+        for member in tar:
+            target = pending.pop(member.name, None) if member.isfile() else None
+            if target is None:
+                continue
+            src_rel, dst = target
+            try:
+                _write_stream(tar.extractfile(member), dst, sizes.get(src_rel))
+                restored_count += 1
+            except Exception as e:
+                print(f"WARNING: Failed to restore {src_rel}: {e}")
+
+    for src_rel, _dst in pending.values():
+        print(f"WARNING: File not found in backup: {src_rel}")
+    return restored_count
+
+
 def restore_backup(
     backup_path: Path,
     slicer_type: SlicerType = None,
     dry_run: bool = False,
     backup_existing: bool = True,
+    skip_verify: bool = False,
 ) -> bool:
     """
     Restore a backup to a slicer installation.
@@ -52,8 +190,9 @@ def restore_backup(
     Args:
         backup_path: Path to backup file/directory
         slicer_type: Target slicer type (auto-detected from backup if None)
-        dry_run: If True, only show what would be restored
+        dry_run: If True, only show what would be restored (implies skip_verify)
         backup_existing: If True, backup existing files before restore
+        skip_verify: If True, trust that the caller has already verified the backup
 
     Returns:
         True if restore succeeded, False otherwise
@@ -62,12 +201,15 @@ def restore_backup(
         ValueError: If backup is invalid or slicer not found
         RuntimeError: If restore fails
     """
-    # Verify backup
-    if not verify_backup(backup_path, verbose=False):
+    # Load manifest once; verification and the restore below both reuse it
+    manifest = load_manifest(backup_path)
+
+    # Verify backup; a dry run writes nothing, so the preview does not need it
+    if not (skip_verify or dry_run) and not verify_backup(
+        backup_path, verbose=False, manifest=manifest
+    ):
         raise ValueError("Backup verification failed")
 
-    # Load manifest to determine slicer type
-    manifest = load_manifest(backup_path)
     if not manifest:
         raise ValueError("Could not load backup manifest")
 
@@ -79,7 +221,7 @@ def restore_backup(
         raise ValueError(f"{slicer.display_name} not found at {slicer.config_path}")
 
     # Get file list
-    file_list = get_restore_file_list(backup_path)
+    file_list = get_restore_file_list(backup_path, slicer=slicer, manifest=manifest)
 
     if dry_run:
         print(f"Would restore {len(file_list)} files to {slicer.config_path}")
@@ -96,38 +238,39 @@ def restore_backup(
         backup_dir = slicer.config_path.parent / "orca_backups_temp"
         backup_dir.mkdir(exist_ok=True)
         try:
-            create_backup(slicer, backup_dir, compress=True, verify=False)
+            # tar.zst is faster to write than ZIP when the extra is installed
+            archive_format = "tar.zst" if zstd_available() else "zip"
+            create_backup(
+                slicer, backup_dir, compress=True, verify=False, archive_format=archive_format
+            )
             print(f"Existing configuration backed up to {backup_dir}")
         except Exception as e:
             raise RuntimeError(f"Failed to backup existing configuration: {e}")
 
-    # Extract backup to temp directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        if backup_path.is_file() and backup_path.suffix == ".zip":
-            extract_archive(backup_path, temp_path)
-            source_dir = temp_path
-        else:
-            source_dir = backup_path
-
-        # Copy files to destination
-        restored_count = 0
-        for src_rel, dst in file_list:
-            src = source_dir / src_rel
-            if not src.exists():
-                print(f"WARNING: File not found in backup: {src_rel}")
-                continue
+    # Stream files from the backup to their destinations
+    sizes = {Path(file_entry.path): file_entry.size for file_entry in manifest.files}
+    if is_zstd_archive(backup_path):
+        restored_count = _restore_zst_files(backup_path, file_list, sizes)
+    elif is_archive(backup_path):
+        with zipfile.ZipFile(backup_path, "r") as zipf:
 
-            # Create parent directory
+            def copy_from_zip(src_rel: Path, dst: Path) -> None:
+                with zipf.open(src_rel.as_posix()) as src:
+                    _write_stream(src, dst, sizes.get(src_rel))
+
+            restored_count = _restore_files(file_list, copy_from_zip)
+    else:
+
+        def copy_from_dir(src_rel: Path, dst: Path) -> None:
+            src = backup_path / src_rel
+            if not src.is_file():
+                raise FileNotFoundError(src)
             dst.parent.mkdir(parents=True, exist_ok=True)
+            _copy_file(src, dst)
 
-            # Copy file
-            try:
-                shutil.copy2(src, dst)
-                restored_count += 1
-            except Exception as e:
-                print(f"WARNING: Failed to restore {src_rel}: {e}")
+        restored_count = _restore_files(file_list, copy_from_dir)
 
+    # The restore may have created the conf file or user directory
+    clear_validity_cache()
     print(f"Restored {restored_count}/{len(file_list)} files")
     return restored_count == len(file_list)
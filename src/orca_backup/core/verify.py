@@ -1,54 +1,159 @@
 """Backup verification functionality."""
 
-import hashlib
-import json
-import tempfile
+import os
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import BinaryIO, Callable, Dict, Optional, Tuple
 
 from orca_backup.models.backup import BackupInfo, BackupManifest
-from orca_backup.utils.compression import extract_archive, is_valid_zip
+from orca_backup.utils.compression import (
+    is_archive,
+    is_valid_zip,
+    is_zstd_archive,
+    open_zst_tar,
+    read_zst_metadata,
+)
+from orca_backup.utils.hashing import calculate_digest, hash_stream
+from orca_backup.utils.paths import iter_files, to_posix
 
 
 def calculate_sha256(file_path: Path) -> str:
     """Calculate SHA256 checksum of a file."""
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+    return calculate_digest(file_path, "sha256")
+
+
+def _check_file(
+    open_entry: Callable[[str], BinaryIO],
+    path: str,
+    expected: str,
+    hash_algorithm: str = "sha256",
+) -> Tuple[str, str]:
+    """Check one backed up file, returning (path, "ok" | "missing" | "mismatch")."""
+    try:
+        f = open_entry(path)
+    except (FileNotFoundError, KeyError):
+        return path, "missing"
+    with f:
+        if hash_stream(f, hash_algorithm) != expected:
+            return path, "mismatch"
+    return path, "ok"
+
+
+def _check_files(
+    manifest: BackupManifest,
+    open_entry: Callable[[str], BinaryIO],
+    verbose: bool,
+    has_entry: Optional[Callable[[str], bool]] = None,
+) -> Optional[Dict[str, str]]:
+    """
+    Check every manifest file in parallel.
+
+    Args:
+        manifest: Manifest listing the expected files
+        open_entry: Callable that opens a backed up file for reading
+        verbose: Whether to check every file instead of stopping at the first bad one
+        has_entry: Cheap existence check run over all files before any hashing
+
+    Returns:
+        Mapping of path to status, or None if a bad file was found in non-verbose mode
+    """
+    if not verbose and has_entry is not None:
+        # A missing file fails the backup; find it before paying for any hashes
+        if not all(has_entry(file_entry.path) for file_entry in manifest.files):
+            return None
+
+    statuses = {}
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [
+            executor.submit(
+                _check_file,
+                open_entry,
+                file_entry.path,
+                file_entry.sha256,
+                manifest.hash_algorithm,
+            )
+            for file_entry in manifest.files
+        ]
+        for future in as_completed(futures):
+            path, status = future.result()
+            statuses[path] = status
+            if status != "ok" and not verbose:
+                # One bad file fails the backup; skip the remaining hashes
+                executor.shutdown(wait=False, cancel_futures=True)
+                return None
+    return statuses
+
+
+def _check_zst_files(
+    backup_path: Path, manifest: BackupManifest, verbose: bool = True
+) -> Optional[Dict[str, str]]:
+    """
+    Check every manifest file in a single pass over a tar.zst stream.
+
+    Returns:
+        Mapping of path to status, or None if a bad file was found in non-verbose mode
+    """
+    expected = {to_posix(f.path): f.sha256 for f in manifest.files}
+    digests = {}
+    with open_zst_tar(backup_path) as tar:
+        for member in tar:
+            if member.isfile():
+                digest = hash_stream(tar.extractfile(member), manifest.hash_algorithm)
+                if not verbose and member.name in expected and digest != expected[member.name]:
+                    # Stop decompressing as soon as one file is known to be bad
+                    return None
+                digests[member.name] = digest
+
+    statuses = {}
+    for file_entry in manifest.files:
+        digest = digests.get(to_posix(file_entry.path))
+        if digest is None:
+            statuses[file_entry.path] = "missing"
+        elif digest != file_entry.sha256:
+            statuses[file_entry.path] = "mismatch"
+        else:
+            statuses[file_entry.path] = "ok"
+    return statuses
 
 
 def load_manifest(backup_path: Path) -> Optional[BackupManifest]:
     """Load backup manifest from a backup file or directory."""
     try:
-        if backup_path.is_file() and backup_path.suffix == ".zip":
+        if backup_path.is_file() and is_zstd_archive(backup_path):
+            # Newer archives carry a copy after the stream; older ones need a scan
+            data = read_zst_metadata(backup_path)
+            if data is not None:
+                return BackupManifest.model_validate_json(data)
+            with open_zst_tar(backup_path) as tar:
+                for member in tar:
+                    if member.name == "backup_manifest.json":
+                        return BackupManifest.model_validate_json(tar.extractfile(member).read())
+        elif backup_path.is_file() and backup_path.suffix == ".zip":
             # Extract manifest from ZIP
             with zipfile.ZipFile(backup_path, "r") as zipf:
-                with zipf.open("backup_manifest.json") as f:
-                    data = json.load(f)
-                    return BackupManifest(**data)
+                return BackupManifest.model_validate_json(zipf.read("backup_manifest.json"))
         elif backup_path.is_dir():
             # Load manifest from directory
             manifest_path = backup_path / "backup_manifest.json"
             if manifest_path.exists():
-                with open(manifest_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    return BackupManifest(**data)
+                return BackupManifest.model_validate_json(manifest_path.read_bytes())
     except Exception:
         return None
 
     return None
 
 
-def verify_backup(backup_path: Path, verbose: bool = False) -> bool:
+def verify_backup(
+    backup_path: Path, verbose: bool = False, manifest: Optional[BackupManifest] = None
+) -> bool:
     """
     Verify the integrity of a backup.
 
     Args:
         backup_path: Path to backup file or directory
         verbose: Whether to print detailed verification info
+        manifest: Already-loaded manifest for this backup (loaded if None)
 
     Returns:
         True if backup is valid, False otherwise
@@ -59,8 +164,8 @@ def verify_backup(backup_path: Path, verbose: bool = False) -> bool:
         return False
 
     # Check if it's a valid ZIP
-    is_compressed = backup_path.is_file() and backup_path.suffix == ".zip"
-    if is_compressed:
+    is_compressed = is_archive(backup_path)
+    if is_compressed and not is_zstd_archive(backup_path):
         if not is_valid_zip(backup_path):
             if verbose:
                 print("ERROR: Invalid or corrupted ZIP file")
@@ -69,7 +174,8 @@ def verify_backup(backup_path: Path, verbose: bool = False) -> bool:
             print("Backup file is valid ZIP archive")
 
     # Load and verify manifest
-    manifest = load_manifest(backup_path)
+    if manifest is None:
+        manifest = load_manifest(backup_path)
     if not manifest:
         if verbose:
             print("ERROR: Manifest file not found or invalid")
@@ -78,65 +184,81 @@ def verify_backup(backup_path: Path, verbose: bool = False) -> bool:
     if verbose:
         print("Manifest file found and valid")
 
-    # Verify files and checksums
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        if is_compressed:
-            # Extract to temp directory
-            extract_archive(backup_path, temp_path)
-            check_dir = temp_path
+    # Verify files and checksums straight from the backup, without extracting it
+    try:
+        if is_compressed and is_zstd_archive(backup_path):
+            statuses = _check_zst_files(backup_path, manifest, verbose)
+        elif is_compressed:
+            with zipfile.ZipFile(backup_path, "r") as zipf:
+                names = set(zipf.namelist())
+                statuses = _check_files(
+                    manifest,
+                    lambda path: zipf.open(to_posix(path)),
+                    verbose,
+                    has_entry=lambda path: to_posix(path) in names,
+                )
         else:
-            check_dir = backup_path
-
-        # Verify all files exist and checksums match
-        missing_files = []
-        checksum_mismatches = []
+            statuses = _check_files(
+                manifest,
+                lambda path: open(backup_path / path, "rb"),
+                verbose,
+                has_entry=lambda path: (backup_path / path).is_file(),
+            )
+    except Exception as e:
+        if verbose:
+            print(f"ERROR: Could not read backup: {e}")
+        return False
 
-        for file_entry in manifest.files:
-            file_path = check_dir / file_entry.path
-            if not file_path.exists():
-                missing_files.append(file_entry.path)
-                continue
+    if statuses is None:
+        return False
 
-            actual_checksum = calculate_sha256(file_path)
-            if actual_checksum != file_entry.sha256:
-                checksum_mismatches.append(file_entry.path)
+    missing_files = [f.path for f in manifest.files if statuses[f.path] == "missing"]
+    checksum_mismatches = [f.path for f in manifest.files if statuses[f.path] == "mismatch"]
 
-        if missing_files:
-            if verbose:
-                print(f"ERROR: Missing files: {len(missing_files)}")
-                for f in missing_files[:5]:  # Show first 5
-                    print(f"  - {f}")
-            return False
-
-        if checksum_mismatches:
-            if verbose:
-                print(f"ERROR: Checksum mismatches: {len(checksum_mismatches)}")
-                for f in checksum_mismatches[:5]:  # Show first 5
-                    print(f"  - {f}")
-            return False
+    if missing_files:
+        if verbose:
+            print(f"ERROR: Missing files: {len(missing_files)}")
+            for f in missing_files[:5]:  # Show first 5
+                print(f"  - {f}")
+        return False
 
+    if checksum_mismatches:
         if verbose:
-            print(f"All {manifest.total_files} files present")
-            print("All checksums verified")
-            print("Backup is valid and complete")
+            print(f"ERROR: Checksum mismatches: {len(checksum_mismatches)}")
+            for f in checksum_mismatches[:5]:  # Show first 5
+                print(f"  - {f}")
+        return False
+
+    if verbose:
+        print(f"All {manifest.total_files} files present")
+        print("All checksums verified")
+        print("Backup is valid and complete")
 
     return True
 
 
-def get_backup_info(backup_path: Path) -> Optional[BackupInfo]:
-    """Get information about a backup."""
+def get_backup_info(backup_path: Path, verify: bool = False) -> Optional[BackupInfo]:
+    """
+    Get information about a backup.
+
+    Args:
+        backup_path: Path to backup file or directory
+        verify: Whether to run full checksum verification (default: False)
+
+    Returns:
+        BackupInfo (is_valid is None unless verify is True), or None if the
+        manifest cannot be loaded
+    """
     manifest = load_manifest(backup_path)
     if not manifest:
         return None
 
-    is_valid = verify_backup(backup_path, verbose=False)
+    is_valid = verify_backup(backup_path, verbose=False, manifest=manifest) if verify else None
 
     if backup_path.is_file():
         size_mb = backup_path.stat().st_size / (1024 * 1024)
     else:
-        total_size = sum(f.stat().st_size for f in backup_path.rglob("*") if f.is_file())
+        total_size = sum(size for _path, size in iter_files(backup_path))
         size_mb = total_size / (1024 * 1024)
 
     return BackupInfo(
@@ -1,5 +1,6 @@
 """Backup-related data models."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
@@ -7,12 +8,17 @@ from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
-class FileEntry(BaseModel):
+@dataclass
+class FileEntry:
     """Information about a single file in a backup."""
 
-    path: str = Field(..., description="Relative path within backup")
-    size: int = Field(..., description="File size in bytes")
-    sha256: str = Field(..., description="SHA256 checksum")
+    # A slotted dataclass instead of a Pydantic model keeps per-file overhead low;
+    # entries loaded from a manifest are still validated by BackupManifest.
+    __slots__ = ("path", "size", "sha256")
+
+    path: str  # Relative path within backup
+    size: int  # File size in bytes
+    sha256: str  # Checksum in the manifest's hash_algorithm (the name predates xxh3)
 
 
 class BackupManifest(BaseModel):
@@ -27,6 +33,9 @@ class BackupManifest(BaseModel):
     total_files: int = Field(..., description="Total number of files in backup")
     total_size: int = Field(..., description="Total size of all files in bytes")
     compressed: bool = Field(default=True, description="Whether backup is compressed")
+    hash_algorithm: str = Field(
+        default="sha256", description="Checksum algorithm for file entries (sha256 or xxh3)"
+    )
 
     class Config:
         """Pydantic configuration."""
@@ -44,7 +53,9 @@ class BackupInfo(BaseModel):
 
     backup_path: Path = Field(..., description="Path to backup file/directory")
     manifest: BackupManifest = Field(..., description="Backup manifest")
-    is_valid: bool = Field(..., description="Whether backup passed verification")
+    is_valid: Optional[bool] = Field(
+        None, description="Whether backup passed verification (None if not checked)"
+    )
     size_mb: float = Field(..., description="Backup size in megabytes")
 
     class Config:
@@ -1,11 +1,35 @@
 """Slicer-related data models."""
 
+import time
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
+# Seconds an is_valid() filesystem check is reused; listings and refreshes repeat it
+VALIDITY_TTL = 5.0
+
+_validity_cache: Dict[Tuple[Path, Path], Tuple[float, bool]] = {}
+
+
+def _paths_exist(conf_file: Path, user_dir: Path) -> bool:
+    """Check that both paths exist, reusing a result younger than VALIDITY_TTL."""
+    key = (conf_file, user_dir)
+    now = time.monotonic()
+    cached = _validity_cache.get(key)
+    if cached is not None and now - cached[0] < VALIDITY_TTL:
+        return cached[1]
+
+    valid = conf_file.exists() and user_dir.exists()
+    _validity_cache[key] = (now, valid)
+    return valid
+
+
+def clear_validity_cache() -> None:
+    """Forget cached is_valid() results, e.g. after creating or removing a profile."""
+    _validity_cache.clear()
+
 
 class SlicerType(str, Enum):
     """Supported slicer types."""
@@ -35,11 +59,12 @@ class SlicerInfo(BaseModel):
         arbitrary_types_allowed = True
 
     def is_valid(self) -> bool:
-        """Check if slicer installation is valid and has required files."""
-        if not self.exists:
-            return False
-        if not self.conf_file or not self.conf_file.exists():
-            return False
-        if not self.user_dir or not self.user_dir.exists():
+        """
+        Check if slicer installation is valid and has required files.
+
+        The filesystem check is cached per path pair for VALIDITY_TTL seconds,
+        since each exists() is a stat that can be slow on network profiles.
+        """
+        if not self.exists or not self.conf_file or not self.user_dir:
             return False
-        return True
+        return _paths_exist(self.conf_file, self.user_dir)
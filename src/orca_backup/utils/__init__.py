@@ -1,6 +1,27 @@
 """Utility functions for orca-backup."""
 
-from orca_backup.utils.compression import compress_directory, extract_archive
-from orca_backup.utils.paths import ensure_directory, get_backup_name
+from orca_backup.utils.compression import (
+    compress_directory,
+    compress_directory_zst,
+    extract_archive,
+)
+from orca_backup.utils.paths import (
+    ensure_directory,
+    get_backup_name,
+    iter_file_stats,
+    iter_files,
+    iter_relative_files,
+    to_posix,
+)
 
-__all__ = ["compress_directory", "extract_archive", "ensure_directory", "get_backup_name"]
+__all__ = [
+    "compress_directory",
+    "compress_directory_zst",
+    "extract_archive",
+    "ensure_directory",
+    "get_backup_name",
+    "iter_file_stats",
+    "iter_files",
+    "iter_relative_files",
+    "to_posix",
+]
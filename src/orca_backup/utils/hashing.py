@@ -0,0 +1,60 @@
+"""File checksum utilities."""
+
+import hashlib
+from pathlib import Path
+from typing import Any, BinaryIO
+
+try:
+    import xxhash
+except ImportError:  # Optional dependency: pip install orca-backup[xxhash]
+    xxhash = None
+
+# Supported checksum algorithms; xxh3 is a fast non-cryptographic corruption check
+HASH_ALGORITHMS = ("sha256", "xxh3")
+
+# Read/copy buffer shared by hashing, archiving and restore
+BUFFER_SIZE = 1 << 20
+
+
+def new_hasher(algorithm: str = "sha256") -> Any:
+    """
+    Create an incremental hasher for a checksum algorithm.
+
+    Args:
+        algorithm: "sha256" or "xxh3" (default: "sha256")
+
+    Returns:
+        Object with update() and hexdigest() methods
+
+    Raises:
+        ValueError: If the algorithm is not supported
+        RuntimeError: If xxh3 is requested but xxhash is not installed
+    """
+    if algorithm == "sha256":
+        return hashlib.sha256()
+    if algorithm == "xxh3":
+        if xxhash is None:
+            raise RuntimeError(
+                "xxh3 checksums require the 'xxhash' package (pip install orca-backup[xxhash])"
+            )
+        return xxhash.xxh3_128()
+    raise ValueError(f"Invalid hash algorithm: {algorithm}")
+
+
+def hash_stream(f: BinaryIO, algorithm: str = "sha256") -> str:
+    """Calculate the checksum of an open binary stream."""
+    # file_digest (Python 3.11+) reuses one 256 KiB buffer via readinto(), saving an
+    # allocation per block; the loop itself is Python and only update() releases the GIL
+    if algorithm == "sha256" and hasattr(hashlib, "file_digest"):
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+    hasher = new_hasher(algorithm)
+    for byte_block in iter(lambda: f.read(BUFFER_SIZE), b""):
+        hasher.update(byte_block)
+    return hasher.hexdigest()
+
+
+def calculate_digest(file_path: Path, algorithm: str = "sha256") -> str:
+    """Calculate the checksum of a file."""
+    with open(file_path, "rb") as f:
+        return hash_stream(f, algorithm)
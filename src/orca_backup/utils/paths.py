@@ -1,27 +1,235 @@
 """Path utility functions."""
 
+import fnmatch
+import os
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterator, List, Optional, Pattern, Sequence, Set, Tuple, Union
+
+# Top-level subdirectories needed before iter_files scans on a thread pool;
+# below this the pool costs more than it saves
+PARALLEL_FANOUT = 4
+
+# Directories ensure_directory has created or found during this process
+_known_directories: Set[Path] = set()
+
+# Timestamp embedded in backup names
+BACKUP_TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S"
+
+# Compiled (file, directory) name filters; None matches nothing
+_Excludes = Tuple[Optional[Pattern[str]], Optional[Pattern[str]]]
 
 
 def ensure_directory(path: Path) -> Path:
-    """Ensure a directory exists, creating it if necessary."""
-    path.mkdir(parents=True, exist_ok=True)
+    """
+    Ensure a directory exists, creating it if necessary.
+
+    Directories this process has already ensured are remembered, so repeat
+    calls skip the mkdir syscall; call clear_directory_cache() after
+    removing one.
+    """
+    if path not in _known_directories:
+        path.mkdir(parents=True, exist_ok=True)
+        _known_directories.add(path)
+    return path
+
+
+def clear_directory_cache() -> None:
+    """Forget which directories ensure_directory has already created."""
+    _known_directories.clear()
+
+
+def _compile_excludes(patterns: Optional[Sequence[str]]) -> _Excludes:
+    """
+    Compile glob patterns into one file regex and one directory regex.
+
+    Patterns match entry names at any depth; a trailing "/" limits a
+    pattern to directories, as in .gitignore.
+
+    Args:
+        patterns: Glob patterns such as "*.log" or "cache/"
+
+    Returns:
+        (file regex, directory regex), each None when nothing applies
+    """
+    file_parts: List[str] = []
+    dir_parts: List[str] = []
+    for pattern in patterns or ():
+        if pattern.endswith("/"):
+            dir_parts.append(fnmatch.translate(pattern.rstrip("/")))
+        else:
+            regex = fnmatch.translate(pattern)
+            file_parts.append(regex)
+            dir_parts.append(regex)
+
+    def join(parts: List[str]) -> Optional[Pattern[str]]:
+        return re.compile("|".join(parts)) if parts else None
+
+    return join(file_parts), join(dir_parts)
+
+
+def _scan_dir(
+    path: str, excludes: _Excludes = (None, None)
+) -> Tuple[List[Tuple[str, os.stat_result]], List[str]]:
+    """Scan one directory, returning its (path, stat) files and its subdirectories."""
+    exclude_file, exclude_dir = excludes
+    files: List[Tuple[str, os.stat_result]] = []
+    subdirs: List[str] = []
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return files, subdirs
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                # An excluded directory is never opened, pruning its whole subtree
+                if exclude_dir is None or not exclude_dir.match(entry.name):
+                    subdirs.append(entry.path)
+            elif entry.is_file():
+                if exclude_file is None or not exclude_file.match(entry.name):
+                    files.append((entry.path, entry.stat()))
+    return files, subdirs
+
+
+def iter_file_stats(
+    root: Union[str, Path],
+    workers: int = 8,
+    exclude_patterns: Optional[Sequence[str]] = None,
+) -> Iterator[Tuple[str, os.stat_result]]:
+    """
+    Walk a directory tree with os.scandir, yielding regular files and their stat.
+
+    Symlinked directories are not followed. DirEntry caches its stat result
+    on most platforms, so each file costs one syscall and no Path object.
+    Trees that fan out widely at the top are scanned on a thread pool, since
+    directory syscalls release the GIL; file order is then not deterministic.
+
+    Args:
+        root: Directory to walk
+        workers: Scanner threads for wide trees, 1 to always scan serially (default: 8)
+        exclude_patterns: Glob patterns for file and directory names to skip;
+            a trailing "/" matches directories only
+
+    Returns:
+        Iterator of (path, stat result) tuples
+    """
+    excludes = _compile_excludes(exclude_patterns)
+    files, subdirs = _scan_dir(os.fspath(root), excludes)
+    yield from files
+
+    if workers <= 1 or len(subdirs) <= PARALLEL_FANOUT:
+        stack = subdirs
+        while stack:
+            files, subdirs = _scan_dir(stack.pop(), excludes)
+            yield from files
+            stack.extend(subdirs)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(_scan_dir, path, excludes) for path in subdirs}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                yield from files
+                pending.update(executor.submit(_scan_dir, path, excludes) for path in subdirs)
+
+
+def iter_files(
+    root: Union[str, Path],
+    workers: int = 8,
+    exclude_patterns: Optional[Sequence[str]] = None,
+) -> Iterator[Tuple[str, int]]:
+    """
+    Walk a directory tree like iter_file_stats, yielding only file sizes.
+
+    Args:
+        root: Directory to walk
+        workers: Scanner threads for wide trees, 1 to always scan serially (default: 8)
+        exclude_patterns: Glob patterns for names to skip, as for iter_file_stats
+
+    Returns:
+        Iterator of (path, size in bytes) tuples
+    """
+    for path, stat in iter_file_stats(root, workers, exclude_patterns):
+        yield path, stat.st_size
+
+
+def to_posix(path: str) -> str:
+    """
+    Convert a native relative path string to "/" separators.
+
+    Same result as Path(path).as_posix() for the relative paths stored in
+    manifests and archives, without building a Path object.
+    """
+    if os.sep != "/":
+        return path.replace(os.sep, "/")
     return path
 
 
-def get_backup_name(slicer_name: str, timestamp: datetime = None, compressed: bool = True) -> str:
-    """Generate a backup filename with timestamp."""
+def iter_relative_files(
+    root: Union[str, Path], exclude_patterns: Optional[Sequence[str]] = None
+) -> Iterator[Tuple[str, str, os.stat_result]]:
+    """
+    Walk a directory tree like iter_file_stats, adding each file's archive name.
+
+    The relative name is sliced off the scanned path rather than computed
+    with Path.relative_to, so no Path objects are built per file.
+
+    Args:
+        root: Directory to walk
+        exclude_patterns: Glob patterns for names to skip, as for iter_file_stats
+
+    Returns:
+        Iterator of (path, "/"-separated path relative to root, stat result) tuples
+    """
+    prefix_len = len(os.path.join(os.fspath(root), ""))
+    for path, stat in iter_file_stats(root, exclude_patterns=exclude_patterns):
+        yield path, to_posix(path[prefix_len:]), stat
+
+
+@lru_cache(maxsize=8)
+def _slicer_display_name(slicer_name: str) -> str:
+    """Filename form of a slicer name, e.g. "orca-flashforge" -> "Orca_Flashforge"."""
+    return slicer_name.replace("-", "_").title()
+
+
+def get_backup_name(
+    slicer_name: str,
+    timestamp: Union[datetime, str] = None,
+    compressed: bool = True,
+    extension: str = ".zip",
+) -> str:
+    """
+    Generate a backup filename with timestamp.
+
+    Args:
+        slicer_name: Slicer identifier
+        timestamp: Backup time, or a string already in BACKUP_TIMESTAMP_FORMAT
+            so batches can format it once (default: now)
+        compressed: Whether to append the archive extension
+        extension: Archive extension (default: ".zip")
+
+    Returns:
+        Backup file or directory name
+    """
     if timestamp is None:
         timestamp = datetime.now()
 
-    timestamp_str = timestamp.strftime("%Y-%m-%d_%H-%M-%S")
-    slicer_display = slicer_name.replace("-", "_").title()
-    extension = ".zip" if compressed else ""
+    if isinstance(timestamp, str):
+        timestamp_str = timestamp
+    else:
+        timestamp_str = timestamp.strftime(BACKUP_TIMESTAMP_FORMAT)
+    if not compressed:
+        extension = ""
 
-    return f"{slicer_display}_backup_{timestamp_str}{extension}"
+    return f"{_slicer_display_name(slicer_name)}_backup_{timestamp_str}{extension}"
 
 
+@lru_cache(maxsize=1)
 def get_default_backup_dir() -> Path:
-    """Get the default backup directory."""
+    """Get the default backup directory (resolved once; Path.home() may query the OS)."""
     return Path.home() / "OrcaBackups"
@@ -9,8 +9,36 @@ from typing import Tuple
 import pytest
 from typer.testing import CliRunner
 
+from orca_backup.core.detector import get_slicer_paths
 from orca_backup.models.backup import BackupManifest, FileEntry
-from orca_backup.models.slicer import SlicerInfo, SlicerType
+from orca_backup.models.slicer import SlicerInfo, SlicerType, clear_validity_cache
+from orca_backup.utils.paths import clear_directory_cache, get_default_backup_dir
+
+
+@pytest.fixture(autouse=True)
+def clear_slicer_paths_cache():
+    """Reset cached slicer paths so platform and home mocks take effect."""
+    get_slicer_paths.cache_clear()
+    yield
+    get_slicer_paths.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_slicer_validity_cache():
+    """Reset cached is_valid() results so filesystem changes in a test are seen."""
+    clear_validity_cache()
+    yield
+    clear_validity_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_path_caches():
+    """Reset cached directories so home mocks and tmp_path cleanups take effect."""
+    get_default_backup_dir.cache_clear()
+    clear_directory_cache()
+    yield
+    get_default_backup_dir.cache_clear()
+    clear_directory_cache()
 
 
 @pytest.fixture
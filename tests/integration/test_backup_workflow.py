@@ -8,7 +8,7 @@ import pytest
 
 from orca_backup.core.backup import create_backup
 from orca_backup.core.detector import get_installed_slicers
-from orca_backup.core.verify import verify_backup
+from orca_backup.core.verify import load_manifest, verify_backup
 from orca_backup.models.slicer import SlicerType
 
 
@@ -47,6 +47,29 @@ class TestBackupWorkflow:
                 assert manifest_data["version"] == "1.0"
                 assert "files" in manifest_data
 
+    def test_full_backup_creation_zstd(self, sample_slicer_info, tmp_path):
+        """Test complete backup creation workflow with tar.zst compression."""
+        pytest.importorskip("zstandard")
+        output_dir = tmp_path / "backups"
+
+        backup_path = create_backup(
+            sample_slicer_info, output_dir, compress=True, verify=True, archive_format="tar.zst"
+        )
+
+        assert backup_path.is_file()
+        assert backup_path.name.endswith(".tar.zst")
+        assert verify_backup(backup_path, verbose=False) is True
+
+        manifest = load_manifest(backup_path)
+        assert manifest is not None
+        assert manifest.slicer == "orcaslicer"
+        assert any(f.path == "OrcaSlicer.conf" for f in manifest.files)
+
+    def test_backup_invalid_archive_format(self, sample_slicer_info, tmp_path):
+        """Test that an unknown archive format is rejected."""
+        with pytest.raises(ValueError, match="Invalid archive format"):
+            create_backup(sample_slicer_info, tmp_path / "backups", archive_format="rar")
+
     def test_full_backup_creation_uncompressed(self, sample_slicer_info, tmp_path):
         """Test complete backup creation workflow without compression."""
         output_dir = tmp_path / "backups"
@@ -237,6 +237,126 @@ class TestBackupCommand:
         assert "Location:" in result.stdout
         assert "Version:" in result.stdout
 
+    def test_backup_compress_level(
+        self, cli_runner, temp_slicer_config, tmp_path, monkeypatch
+    ):
+        """Test that --compress-level is passed through to create_backup."""
+        config_path, _, _ = temp_slicer_config
+        output_dir = tmp_path / "backups"
+
+        def mock_paths():
+            return {
+                "orcaslicer": config_path,
+                "orca-flashforge": config_path.parent / "Orca-Flashforge",
+            }
+
+        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+
+        from orca_backup.core.backup import create_backup as real_create_backup
+
+        levels = []
+
+        def spy_create_backup(*args, **kwargs):
+            levels.append(kwargs.get("compress_level"))
+            return real_create_backup(*args, **kwargs)
+
+        monkeypatch.setattr("orca_backup.cli.create_backup", spy_create_backup)
+
+        result = cli_runner.invoke(
+            app,
+            [
+                "backup",
+                "--slicer",
+                "orcaslicer",
+                "--output",
+                str(output_dir),
+                "--compress-level",
+                "1",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert levels == [1]
+
+    def test_backup_zstd_format(
+        self, cli_runner, temp_slicer_config, tmp_path, monkeypatch
+    ):
+        """Test creating a tar.zst backup from the CLI."""
+        pytest.importorskip("zstandard")
+        config_path, _, _ = temp_slicer_config
+        output_dir = tmp_path / "backups"
+
+        def mock_paths():
+            return {
+                "orcaslicer": config_path,
+                "orca-flashforge": config_path.parent / "Orca-Flashforge",
+            }
+
+        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+
+        result = cli_runner.invoke(
+            app,
+            ["backup", "--slicer", "orcaslicer", "--output", str(output_dir), "--format", "tar.zst"],
+        )
+
+        assert result.exit_code == 0
+        backups = list(output_dir.iterdir())
+        assert len(backups) == 1
+        assert backups[0].name.endswith(".tar.zst")
+
+    def test_backup_invalid_format(self, cli_runner, tmp_path):
+        """Test backup with an unknown archive format."""
+        result = cli_runner.invoke(
+            app, ["backup", "--output", str(tmp_path), "--format", "rar"]
+        )
+
+        assert result.exit_code == 1
+        assert "Invalid format" in result.stdout
+
+    def test_backup_xxh3_hash(self, cli_runner, temp_slicer_config, tmp_path, monkeypatch):
+        """Test creating and verifying an xxh3 backup from the CLI."""
+        pytest.importorskip("xxhash")
+        config_path, _, _ = temp_slicer_config
+        output_dir = tmp_path / "backups"
+
+        def mock_paths():
+            return {
+                "orcaslicer": config_path,
+                "orca-flashforge": config_path.parent / "Orca-Flashforge",
+            }
+
+        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+
+        result = cli_runner.invoke(
+            app,
+            ["backup", "--slicer", "orcaslicer", "--output", str(output_dir), "--hash", "xxh3"],
+        )
+
+        assert result.exit_code == 0
+        backups = list(output_dir.iterdir())
+        assert len(backups) == 1
+
+        result = cli_runner.invoke(app, ["info", str(backups[0]), "--verify"])
+
+        assert result.exit_code == 0
+        assert "xxh3" in result.stdout
+
+    def test_backup_invalid_hash(self, cli_runner, tmp_path):
+        """Test backup with an unknown hash algorithm."""
+        result = cli_runner.invoke(app, ["backup", "--output", str(tmp_path), "--hash", "md5"])
+
+        assert result.exit_code == 1
+        assert "Invalid hash algorithm" in result.stdout
+
+    def test_backup_compress_level_out_of_range(self, cli_runner, tmp_path):
+        """Test that an out-of-range --compress-level is rejected."""
+        result = cli_runner.invoke(
+            app,
+            ["backup", "--slicer", "orcaslicer", "--output", str(tmp_path), "--compress-level", "10"],
+        )
+
+        assert result.exit_code != 0
+
 
 class TestRestoreCommand:
     """Tests for 'restore' CLI command."""
@@ -316,6 +436,23 @@ class TestRestoreCommand:
         assert result.exit_code == 0
         assert "dry run" in result.stdout.lower()
 
+    def test_restore_no_verify(self, cli_runner, tmp_path, monkeypatch):
+        """Test that --no-verify is passed through to restore_backup."""
+        backup_path = tmp_path / "backup.zip"
+        backup_path.write_bytes(b"")
+        calls = []
+
+        def mock_restore(path, **kwargs):
+            calls.append(kwargs)
+            return True
+
+        monkeypatch.setattr("orca_backup.cli.restore_backup", mock_restore)
+
+        result = cli_runner.invoke(app, ["restore", str(backup_path), "--no-verify"])
+
+        assert result.exit_code == 0
+        assert calls[0]["skip_verify"] is True
+
     def test_restore_nonexistent_backup(self, cli_runner, tmp_path):
         """Test restore with non-existent backup."""
         nonexistent = tmp_path / "nonexistent.zip"
@@ -405,6 +542,13 @@ class TestInfoCommand:
         assert "Backup Information" in result.stdout
         assert "Slicer" in result.stdout
         assert "Total Files" in result.stdout
+        assert "Not checked" in result.stdout
+
+        result = cli_runner.invoke(app, ["info", str(backup_path), "--verify"])
+
+        assert result.exit_code == 0
+        assert "Not checked" not in result.stdout
+        assert result.stdout.count("Yes") == 2  # Compressed and Valid
 
     def test_info_invalid_backup(self, cli_runner, tmp_path):
         """Test info command with invalid backup."""
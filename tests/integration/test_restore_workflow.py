@@ -67,6 +67,46 @@ class TestRestoreWorkflow:
         restored_conf_content = (target_config_path / "OrcaSlicer.conf").read_text()
         assert restored_conf_content == original_conf_content
 
+    def test_zstd_backup_restore_cycle(self, temp_slicer_config, tmp_path, monkeypatch):
+        """Test backup and restore cycle through a tar.zst archive."""
+        pytest.importorskip("zstandard")
+        source_config_path, source_conf, source_user = temp_slicer_config
+
+        def mock_paths():
+            return {
+                "orcaslicer": source_config_path,
+                "orca-flashforge": tmp_path / "Orca-Flashforge",
+            }
+
+        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+
+        from orca_backup.core.detector import get_slicer_info
+
+        source_slicer = get_slicer_info(SlicerType.ORCASLICER)
+        backup_path = create_backup(
+            source_slicer, tmp_path / "backups", compress=True, archive_format="tar.zst"
+        )
+
+        target_config_path = tmp_path / "restored" / "OrcaSlicer"
+        target_config_path.mkdir(parents=True)
+
+        def mock_paths_restore():
+            return {
+                "orcaslicer": target_config_path,
+                "orca-flashforge": tmp_path / "Orca-Flashforge",
+            }
+
+        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths_restore)
+
+        success = restore_backup(backup_path, backup_existing=False)
+
+        assert success is True
+        assert (target_config_path / "OrcaSlicer.conf").read_text() == source_conf.read_text()
+        for file_path in source_user.rglob("*"):
+            if file_path.is_file():
+                restored = target_config_path / file_path.relative_to(source_config_path)
+                assert calculate_sha256(restored) == calculate_sha256(file_path)
+
     def test_restore_preserves_checksums(
         self, temp_slicer_config, tmp_path, monkeypatch
     ):
@@ -174,8 +214,8 @@ class TestRestoreWorkflow:
         temp_backup_dir = target_config_path.parent / "orca_backups_temp"
         assert temp_backup_dir.exists()
 
-        # Verify temp backup contains files
-        backup_files = list(temp_backup_dir.glob("*.zip"))
+        # Verify temp backup contains files (tar.zst when zstandard is installed)
+        backup_files = list(temp_backup_dir.glob("*.zip")) + list(temp_backup_dir.glob("*.tar.zst"))
         assert len(backup_files) >= 1
 
     def test_restore_dry_run_no_changes(
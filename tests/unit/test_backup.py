@@ -2,19 +2,24 @@
 
 import json
 import platform
+import zipfile
 from datetime import datetime
 from pathlib import Path
 
 import pytest
 
 from orca_backup.core.backup import (
+    _manifest_json,
     calculate_sha256,
+    collect_backup_files,
+    copy_and_hash,
     copy_file_with_metadata,
     create_backup,
     create_backup_staging,
     create_manifest,
+    write_zip_backup,
 )
-from orca_backup.models.backup import FileEntry
+from orca_backup.models.backup import BackupManifest, FileEntry
 from orca_backup.models.slicer import SlicerInfo, SlicerType
 
 
@@ -46,6 +51,33 @@ class TestCalculateSha256:
         assert checksum1 != checksum2
 
 
+class TestCopyAndHash:
+    """Tests for copy_and_hash function."""
+
+    def test_copies_content_and_returns_checksum(self, tmp_path):
+        """Test that the copy matches the source and the checksum is correct."""
+        src = tmp_path / "src.bin"
+        src.write_bytes(bytes(range(256)) * 100)
+        dst = tmp_path / "dst.bin"
+
+        checksum = copy_and_hash(src, dst)
+
+        assert dst.read_bytes() == src.read_bytes()
+        assert checksum == calculate_sha256(src)
+
+    def test_empty_file(self, tmp_path):
+        """Test copying an empty file."""
+        src = tmp_path / "empty.txt"
+        src.write_bytes(b"")
+        dst = tmp_path / "copy.txt"
+
+        checksum = copy_and_hash(src, dst)
+
+        assert dst.exists()
+        assert dst.stat().st_size == 0
+        assert checksum == calculate_sha256(src)
+
+
 class TestCopyFileWithMetadata:
     """Tests for copy_file_with_metadata function."""
 
@@ -123,6 +155,45 @@ class TestCopyFileWithMetadata:
         assert dst_file.stat().st_mtime == src_file.stat().st_mtime
 
 
+class TestCollectBackupFiles:
+    """Tests for collect_backup_files function."""
+
+    def test_collects_user_files(self, sample_slicer_info):
+        """Test that every user file is collected with its relative path."""
+        files = collect_backup_files(sample_slicer_info)
+
+        expected = {
+            str(p.relative_to(sample_slicer_info.config_path))
+            for p in sample_slicer_info.user_dir.rglob("*")
+            if p.is_file()
+        }
+        assert {rel for _, rel, _ in files} == expected
+        for src, rel, size in files:
+            assert src == sample_slicer_info.config_path / rel
+            assert size == src.stat().st_size
+
+    def test_collects_custom_scripts(self, sample_flashforge_info):
+        """Test that custom_scripts files are collected."""
+        files = collect_backup_files(sample_flashforge_info)
+
+        assert any(rel.startswith("custom_scripts") for _, rel, _ in files)
+
+    def test_excludes_conf_file(self, sample_slicer_info):
+        """Test that the conf file is handled separately."""
+        files = collect_backup_files(sample_slicer_info)
+
+        assert "OrcaSlicer.conf" not in {rel for _, rel, _ in files}
+
+    def test_directory_outside_config_path(self, sample_slicer_info, tmp_path):
+        """Test that a user directory outside config_path is rejected."""
+        outside = tmp_path / "elsewhere"
+        outside.mkdir()
+        slicer = sample_slicer_info.model_copy(update={"user_dir": outside})
+
+        with pytest.raises(ValueError):
+            collect_backup_files(slicer)
+
+
 class TestCreateBackupStaging:
     """Tests for create_backup_staging function."""
 
@@ -202,6 +273,48 @@ class TestCreateBackupStaging:
             # Paths should not be absolute
             assert not Path(entry.path).is_absolute()
 
+    def test_checksums_match_sources(self, sample_slicer_info, tmp_path):
+        """Test that parallel hashing produces the same checksums as serial hashing."""
+        staging_dir = tmp_path / "staging"
+        staging_dir.mkdir()
+
+        entries = create_backup_staging(sample_slicer_info, staging_dir)
+
+        for entry in entries:
+            source = sample_slicer_info.config_path / entry.path
+            assert entry.sha256 == calculate_sha256(source)
+            assert entry.size == source.stat().st_size
+
+
+class TestWriteZipBackup:
+    """Tests for write_zip_backup function."""
+
+    def test_entries_match_sources(self, sample_slicer_info, tmp_path):
+        """Test that streamed entries hash and size the source files."""
+        output_path = tmp_path / "backup.zip"
+
+        manifest = write_zip_backup(sample_slicer_info, output_path, datetime.now())
+
+        assert manifest.files[0].path == "OrcaSlicer.conf"
+        with zipfile.ZipFile(output_path, "r") as zipf:
+            for entry in manifest.files:
+                source = sample_slicer_info.config_path / entry.path
+                assert entry.sha256 == calculate_sha256(source)
+                assert entry.size == source.stat().st_size
+                assert zipf.read(Path(entry.path).as_posix()) == source.read_bytes()
+
+    def test_manifest_written_to_archive(self, sample_slicer_info, tmp_path):
+        """Test that the manifest is stored in the archive."""
+        output_path = tmp_path / "backup.zip"
+        created_at = datetime(2025, 11, 14, 12, 0, 0)
+
+        manifest = write_zip_backup(sample_slicer_info, output_path, created_at)
+
+        with zipfile.ZipFile(output_path, "r") as zipf:
+            data = json.loads(zipf.read("backup_manifest.json"))
+        assert data["total_files"] == manifest.total_files
+        assert data["created_at"] == "2025-11-14T12:00:00"
+
 
 class TestCreateManifest:
     """Tests for create_manifest function."""
@@ -248,6 +361,34 @@ class TestCreateManifest:
         assert manifest.slicer_version is None
 
 
+class TestManifestJson:
+    """Tests for _manifest_json function."""
+
+    def test_compact_output(self, sample_slicer_info, sample_file_entries):
+        """Test that the manifest is serialized without indentation."""
+        manifest = create_manifest(sample_slicer_info, sample_file_entries, compressed=True)
+
+        data = _manifest_json(manifest)
+
+        assert isinstance(data, bytes)
+        assert b"\n" not in data
+        assert b'", "' not in data
+
+    def test_round_trip(self, sample_slicer_info, sample_file_entries):
+        """Test that the serialized manifest loads back unchanged."""
+        manifest = create_manifest(
+            sample_slicer_info,
+            sample_file_entries,
+            compressed=True,
+            created_at=datetime(2025, 11, 14, 12, 0, 0),
+        )
+
+        loaded = BackupManifest.model_validate_json(_manifest_json(manifest))
+
+        assert loaded == manifest
+        assert json.loads(_manifest_json(manifest))["created_at"] == "2025-11-14T12:00:00"
+
+
 class TestCreateBackup:
     """Tests for create_backup function."""
 
@@ -319,6 +460,90 @@ class TestCreateBackup:
         with pytest.raises(RuntimeError, match="Backup verification failed"):
             create_backup(sample_slicer_info, output_dir, compress=True, verify=True)
 
+    def test_create_backup_skips_staging_copy(self, sample_slicer_info, tmp_path, monkeypatch):
+        """Test that backups are written without a temporary staging directory."""
+
+        def no_temp_dir(*args, **kwargs):
+            raise AssertionError("staging directory should not be used")
+
+        monkeypatch.setattr("tempfile.TemporaryDirectory", no_temp_dir)
+
+        zip_path = create_backup(sample_slicer_info, tmp_path / "zip", compress=True, verify=False)
+        dir_path = create_backup(sample_slicer_info, tmp_path / "dir", compress=False, verify=False)
+
+        assert zip_path.is_file()
+        assert dir_path.is_dir()
+
+    def test_create_backup_removes_partial_output(self, sample_slicer_info, tmp_path, monkeypatch):
+        """Test that a failed backup does not leave a partial file behind."""
+        output_dir = tmp_path / "backups"
+
+        def failing_add(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("orca_backup.core.backup.add_files_to_zip", failing_add)
+
+        with pytest.raises(OSError, match="disk full"):
+            create_backup(sample_slicer_info, output_dir, compress=True, verify=False)
+
+        assert list(output_dir.iterdir()) == []
+
+    @pytest.mark.parametrize(
+        "compress, archive_format",
+        [(False, "zip"), (True, "zip"), (True, "tar.zst")],
+        ids=["directory", "zip", "tar.zst"],
+    )
+    def test_create_backup_name_clash_keeps_existing(
+        self, sample_slicer_info, tmp_path, monkeypatch, compress, archive_format
+    ):
+        """Test that a clashing backup name raises and leaves the earlier backup intact."""
+        from orca_backup.core.verify import load_manifest, verify_backup
+
+        if archive_format == "tar.zst":
+            pytest.importorskip("zstandard")
+        fixed = datetime(2025, 11, 14, 12, 0, 0)
+
+        class FixedDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return fixed
+
+        monkeypatch.setattr("orca_backup.core.backup.datetime", FixedDatetime)
+        output_dir = tmp_path / "backups"
+        kwargs = {"compress": compress, "verify": False, "archive_format": archive_format}
+        first = create_backup(sample_slicer_info, output_dir, **kwargs)
+        manifest_before = load_manifest(first)
+
+        with pytest.raises(FileExistsError):
+            create_backup(sample_slicer_info, output_dir, **kwargs)
+
+        assert load_manifest(first) == manifest_before
+        assert verify_backup(first)
+
+    @pytest.mark.parametrize("compress", [True, False])
+    def test_create_backup_xxh3(self, sample_slicer_info, tmp_path, compress):
+        """Test that xxh3 backups record the algorithm and pass verification."""
+        xxhash = pytest.importorskip("xxhash")
+        from orca_backup.core.verify import load_manifest
+
+        backup_path = create_backup(
+            sample_slicer_info,
+            tmp_path / "backups",
+            compress=compress,
+            hash_algorithm="xxh3",
+        )
+
+        manifest = load_manifest(backup_path)
+        assert manifest.hash_algorithm == "xxh3"
+        conf_entry = manifest.files[0]
+        expected = xxhash.xxh3_128(sample_slicer_info.conf_file.read_bytes()).hexdigest()
+        assert conf_entry.sha256 == expected
+
+    def test_create_backup_invalid_hash_algorithm(self, sample_slicer_info, tmp_path):
+        """Test that an unknown hash algorithm raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid hash algorithm"):
+            create_backup(sample_slicer_info, tmp_path / "backups", hash_algorithm="md5")
+
     def test_create_backup_invalid_slicer(self, tmp_path):
         """Test that invalid slicer raises ValueError."""
         invalid_slicer = SlicerInfo(
@@ -1,11 +1,40 @@
 """Unit tests for compression utilities."""
 
+import hashlib
+import os
+import threading
+import time
 import zipfile
+import zlib
 from pathlib import Path
 
 import pytest
 
-from orca_backup.utils.compression import compress_directory, extract_archive, is_valid_zip
+from orca_backup.utils import compression
+from orca_backup.utils.compression import (
+    add_file_to_zip,
+    add_files_to_zip,
+    append_zst_metadata,
+    compress_directory,
+    compress_directory_zst,
+    extract_archive,
+    is_archive,
+    is_valid_zip,
+    is_zstd_archive,
+    read_zst_metadata,
+    write_zip_entry,
+    zipinfo_from_stat,
+)
+
+
+def use_deflate_backend(monkeypatch, backend):
+    """Make only the given in-memory DEFLATE backend available ("zlib" for neither)."""
+    if backend != "zlib":
+        pytest.importorskip({"isal": "isal", "libdeflate": "deflate"}[backend])
+    if backend != "isal":
+        monkeypatch.setattr(compression, "isal_zlib", None)
+    if backend != "libdeflate":
+        monkeypatch.setattr(compression, "deflate", None)
 
 
 class TestCompressDirectory:
@@ -115,6 +144,679 @@ class TestCompressDirectory:
             # Compressed size should be smaller
             assert info.compress_size < info.file_size
 
+    def test_preserves_modification_time(self, tmp_path):
+        """Test that entries keep the source file's timestamp."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        file_path = source_dir / "file.txt"
+        file_path.write_text("content")
+        os.utime(file_path, (1_600_000_000, 1_600_000_000))
+
+        output_file = compress_directory(source_dir, tmp_path / "out.zip")
+
+        with zipfile.ZipFile(output_file) as zipf:
+            assert zipf.testzip() is None
+            expected = time.localtime(1_600_000_000)[:6]
+            assert zipf.getinfo("file.txt").date_time == expected
+
+    def test_compress_level_controls_size(self, tmp_path):
+        """Test that a higher compression level does not produce a larger archive."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "profile.json").write_text(
+            "".join(f'{{"layer_height": {i / 100}, "speed": {i}}}\n' for i in range(2000))
+        )
+
+        fast = compress_directory(source_dir, tmp_path / "fast.zip", compresslevel=1)
+        small = compress_directory(source_dir, tmp_path / "small.zip", compresslevel=9)
+
+        assert small.stat().st_size <= fast.stat().st_size
+        with zipfile.ZipFile(small, "r") as zipf:
+            assert zipf.read("profile.json") == (source_dir / "profile.json").read_bytes()
+
+
+    def test_compressed_formats_are_stored(self, tmp_path):
+        """Test that already-compressed formats skip DEFLATE while configs keep it."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        payload = b"orca" * 1000
+        (source_dir / "plate.3MF").write_bytes(payload)
+        (source_dir / "cover.png").write_bytes(payload)
+        (source_dir / "profile.json").write_bytes(payload)
+
+        output_file = compress_directory(source_dir, tmp_path / "out.zip")
+
+        with zipfile.ZipFile(output_file) as zipf:
+            assert zipf.getinfo("plate.3MF").compress_type == zipfile.ZIP_STORED
+            assert zipf.getinfo("cover.png").compress_type == zipfile.ZIP_STORED
+            assert zipf.getinfo("profile.json").compress_type == zipfile.ZIP_DEFLATED
+            assert zipf.read("plate.3MF") == payload
+            assert zipf.testzip() is None
+
+    def test_default_excludes(self, tmp_path):
+        """Test that OS metadata and cache files are left out by default."""
+        source_dir = tmp_path / "source"
+        (source_dir / "thumbnails").mkdir(parents=True)
+        (source_dir / "profile.json").write_text("{}")
+        (source_dir / ".DS_Store").write_bytes(b"\x00")
+        (source_dir / "slicer.cache").write_text("cached")
+        (source_dir / "thumbnails" / "plate.png").write_bytes(b"png")
+
+        output_file = compress_directory(source_dir, tmp_path / "out.zip")
+
+        with zipfile.ZipFile(output_file) as zipf:
+            assert zipf.namelist() == ["profile.json"]
+
+    def test_custom_excludes_prune_directories(self, tmp_path, monkeypatch):
+        """Test that an excluded directory is never scanned."""
+        source_dir = tmp_path / "source"
+        (source_dir / "log").mkdir(parents=True)
+        (source_dir / "user").mkdir()
+        (source_dir / "log" / "debug.txt").write_text("log")
+        (source_dir / "user" / "debug.log").write_text("log")
+        (source_dir / "user" / "pla.json").write_text("{}")
+        scanned = []
+        real_scandir = os.scandir
+
+        def spy_scandir(path):
+            scanned.append(Path(path).name)
+            return real_scandir(path)
+
+        monkeypatch.setattr("orca_backup.utils.paths.os.scandir", spy_scandir)
+
+        output_file = compress_directory(
+            source_dir, tmp_path / "out.zip", exclude_patterns=["log/", "*.log"]
+        )
+
+        assert "log" not in scanned
+        with zipfile.ZipFile(output_file) as zipf:
+            assert zipf.namelist() == ["user/pla.json"]
+
+    def test_empty_excludes_keep_everything(self, tmp_path):
+        """Test that an empty pattern list disables the default excludes."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / ".DS_Store").write_bytes(b"\x00")
+
+        output_file = compress_directory(source_dir, tmp_path / "out.zip", exclude_patterns=[])
+
+        with zipfile.ZipFile(output_file) as zipf:
+            assert zipf.namelist() == [".DS_Store"]
+
+
+class TestCreateZip:
+    """Tests for create_zip function."""
+
+    def test_preallocates_and_truncates(self, tmp_path, monkeypatch):
+        """Test that the reservation is made and trimmed off once the archive closes."""
+        calls = []
+        real_fallocate = getattr(os, "posix_fallocate", None)
+
+        def spy_fallocate(fd, offset, size):
+            calls.append(size)
+            if real_fallocate is not None:
+                real_fallocate(fd, offset, size)
+
+        monkeypatch.setattr(compression.os, "posix_fallocate", spy_fallocate, raising=False)
+        zip_path = tmp_path / "out.zip"
+
+        size = compression.PREALLOCATE_MIN_SIZE
+        with compression.create_zip(zip_path, size_estimate=size) as zipf:
+            zipf.writestr("file.txt", "content")
+
+        assert calls == [size]
+        assert zip_path.stat().st_size < size
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert zipf.testzip() is None
+            assert zipf.read("file.txt") == b"content"
+
+    def test_small_estimates_are_not_preallocated(self, tmp_path, monkeypatch):
+        """Test that outputs below PREALLOCATE_MIN_SIZE skip the reservation."""
+        calls = []
+        monkeypatch.setattr(
+            compression.os, "posix_fallocate", lambda *args: calls.append(args), raising=False
+        )
+
+        with compression.create_zip(
+            tmp_path / "out.zip", size_estimate=compression.PREALLOCATE_MIN_SIZE - 1
+        ) as zipf:
+            zipf.writestr("file.txt", "content")
+
+        assert calls == []
+
+    def test_without_posix_fallocate(self, tmp_path, monkeypatch):
+        """Test that archives are still written where preallocation is unavailable."""
+        monkeypatch.delattr(os, "posix_fallocate", raising=False)
+        zip_path = tmp_path / "out.zip"
+
+        with compression.create_zip(zip_path, size_estimate=4096) as zipf:
+            zipf.writestr("file.txt", "content")
+
+        assert zipfile.is_zipfile(zip_path)
+
+
+class TestEstimateZipSize:
+    """Tests for estimate_zip_size function."""
+
+    def test_quarters_text_and_keeps_stored_sizes(self):
+        """Test that DEFLATE entries count at a quarter size and stored ones in full."""
+        text = zipfile.ZipInfo("a.json")
+        text.file_size = 1000
+        image = zipfile.ZipInfo("b.png")
+        image.file_size = 1000
+
+        estimate = compression.estimate_zip_size([(None, text), (None, image)])
+
+        assert estimate == 250 + 1000 + (128 + 2 * 6) + (128 + 2 * 5)
+
+
+class TestZipinfoFromStat:
+    """Tests for zipinfo_from_stat function."""
+
+    def test_matches_from_file(self, tmp_path):
+        """Test that the metadata equals what ZipInfo.from_file builds."""
+        source = tmp_path / "profile.json"
+        source.write_text("{}")
+        os.utime(source, (1_600_000_000, 1_600_000_000))
+
+        zinfo = zipinfo_from_stat("user/profile.json", source.stat())
+        expected = zipfile.ZipInfo.from_file(source, "user/profile.json")
+
+        assert zinfo.filename == expected.filename
+        assert zinfo.date_time == expected.date_time
+        assert zinfo.external_attr == expected.external_attr
+        assert zinfo.file_size == expected.file_size
+
+    def test_clamps_timestamps_outside_dos_range(self, tmp_path):
+        """Test that pre-1980 timestamps are clamped instead of raising."""
+        source = tmp_path / "old.json"
+        source.write_text("{}")
+        os.utime(source, (86_400 * 365, 86_400 * 365))
+
+        zinfo = zipinfo_from_stat("old.json", source.stat())
+
+        assert zinfo.date_time == (1980, 1, 1, 0, 0, 0)
+
+    def test_compress_directory_skips_from_file(self, tmp_path, monkeypatch):
+        """Test that compress_directory reuses the scan's stat results."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "file.txt").write_text("content")
+
+        def no_from_file(*args, **kwargs):
+            raise AssertionError("ZipInfo.from_file should not be called")
+
+        monkeypatch.setattr(zipfile.ZipInfo, "from_file", no_from_file)
+
+        output_file = compress_directory(source_dir, tmp_path / "out.zip")
+
+        with zipfile.ZipFile(output_file) as zipf:
+            assert zipf.read("file.txt") == b"content"
+
+
+class TestAddFileToZip:
+    """Tests for add_file_to_zip function."""
+
+    def test_streams_and_hashes(self, tmp_path):
+        """Test that the entry content, byte count and hash match the source."""
+        source = tmp_path / "file.bin"
+        source.write_bytes(b"orca" * 1000)
+        hasher = hashlib.sha256()
+
+        with zipfile.ZipFile(tmp_path / "out.zip", "w", zipfile.ZIP_DEFLATED) as zipf:
+            size = add_file_to_zip(zipf, source, "dir/file.bin", hasher=hasher)
+
+        assert size == 4000
+        assert hasher.hexdigest() == hashlib.sha256(source.read_bytes()).hexdigest()
+        with zipfile.ZipFile(tmp_path / "out.zip") as zipf:
+            assert zipf.read("dir/file.bin") == source.read_bytes()
+
+    def test_known_size_skips_stat(self, tmp_path, monkeypatch):
+        """Test that a size from an earlier scan avoids another stat call."""
+        source = tmp_path / "file.txt"
+        source.write_text("content")
+
+        def no_fstat(fd):
+            raise AssertionError("fstat should not be called")
+
+        monkeypatch.setattr(compression.os, "fstat", no_fstat)
+
+        with zipfile.ZipFile(tmp_path / "out.zip", "w") as zipf:
+            size = add_file_to_zip(zipf, source, "file.txt", file_size=7)
+
+        assert size == 7
+
+    def test_streams_without_hasher(self, tmp_path, monkeypatch):
+        """Test that the unhashed streaming path reports the size it wrote."""
+        source = tmp_path / "file.bin"
+        source.write_bytes(os.urandom(3 * compression.BUFFER_SIZE + 17))
+        monkeypatch.setattr(compression, "_use_in_memory", lambda compress_type, size: False)
+
+        with zipfile.ZipFile(tmp_path / "out.zip", "w", zipfile.ZIP_DEFLATED) as zipf:
+            size = add_file_to_zip(zipf, source, "file.bin")
+
+        assert size == source.stat().st_size
+        with zipfile.ZipFile(tmp_path / "out.zip") as zipf:
+            assert zipf.read("file.bin") == source.read_bytes()
+            assert zipf.testzip() is None
+
+
+class TestCrc32:
+    """Tests for _crc32 function."""
+
+    @pytest.mark.parametrize("backend", ["isal", "libdeflate", "zlib"])
+    def test_matches_zlib(self, monkeypatch, backend):
+        """Test that the CRC matches zlib's with every backend."""
+        use_deflate_backend(monkeypatch, backend)
+        data = os.urandom(100_000)
+
+        assert compression._crc32(data) == zlib.crc32(data)
+        assert compression._crc32(b"") == 0
+
+
+class TestRawDeflate:
+    """Tests for _raw_deflate function."""
+
+    @pytest.mark.parametrize("backend", ["isal", "libdeflate", "zlib"])
+    @pytest.mark.parametrize("level", [0, 1, 3, 6, 9])
+    def test_round_trip(self, monkeypatch, backend, level):
+        """Test that every backend and level produces a valid raw DEFLATE stream."""
+        use_deflate_backend(monkeypatch, backend)
+        data = b'{"layer_height": 0.2, "speed": 120}\n' * 1000
+
+        compressed = compression._raw_deflate(data, level)
+
+        assert zlib.decompress(compressed, -15) == data
+        if level > 0:
+            assert len(compressed) < len(data) // 4
+
+    def test_isal_level_mapping(self):
+        """Test that zlib levels map onto isal's 0-3 range."""
+        levels = [compression._isal_level(level) for level in range(1, 10)]
+
+        assert levels == [1, 1, 1, 2, 2, 2, 3, 3, 3]
+
+
+class TestReadFile:
+    """Tests for _read_file function."""
+
+    @pytest.mark.parametrize("size_hint", [0, 5, 11, 12, 100])
+    def test_reads_whole_file_for_any_hint(self, tmp_path, size_hint):
+        """Test that stale or missing size hints still return the full contents."""
+        source = tmp_path / "file.txt"
+        source.write_bytes(b"hello world!")
+
+        assert compression._read_file(source, size_hint) == b"hello world!"
+
+    def test_reads_past_buffer_after_growth(self, tmp_path):
+        """Test that a file larger than its hint is read across several calls."""
+        source = tmp_path / "file.bin"
+        data = os.urandom(2 * compression.BUFFER_SIZE + 3)
+        source.write_bytes(data)
+
+        assert compression._read_file(str(source), 10) == data
+
+    def test_short_reads_are_not_treated_as_eof(self, tmp_path, monkeypatch):
+        """Test that a filesystem returning short reads still yields the whole file."""
+        source = tmp_path / "file.bin"
+        data = os.urandom(100000)
+        source.write_bytes(data)
+        real_read = os.read
+        monkeypatch.setattr(compression.os, "read", lambda fd, n: real_read(fd, min(n, 4096)))
+
+        assert compression._read_file(source, len(data)) == data
+
+
+class TestAddFilesToZip:
+    """Tests for add_files_to_zip function."""
+
+    def _entries(self, tmp_path, count):
+        entries = []
+        for i in range(count):
+            file_path = tmp_path / f"file{i}.txt"
+            file_path.write_text(f"content {i} " * (i + 1))
+            os.utime(file_path, (1_600_000_000, 1_600_000_000))  # Even seconds for ZIP
+            entries.append((file_path, zipfile.ZipInfo.from_file(file_path, f"dir/file{i}.txt")))
+        return entries
+
+    @pytest.mark.parametrize("backend", ["isal", "libdeflate", "zlib"])
+    def test_entries_in_order_with_checksums(self, tmp_path, monkeypatch, backend):
+        """Test that every file is written in order and hashed with every backend."""
+        use_deflate_backend(monkeypatch, backend)
+        entries = self._entries(tmp_path, 30)
+        zip_path = tmp_path / "out.zip"
+
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            results = add_files_to_zip(zipf, entries, hash_algorithm="sha256", max_workers=2)
+
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert zipf.testzip() is None
+            assert zipf.namelist() == [zinfo.filename for _, zinfo in entries]
+        for (file_path, _), (size, checksum) in zip(entries, results):
+            data = file_path.read_bytes()
+            assert size == len(data)
+            assert checksum == hashlib.sha256(data).hexdigest()
+
+    def test_without_hashing(self, tmp_path):
+        """Test that no checksum is returned when no algorithm is given."""
+        entries = self._entries(tmp_path, 2)
+
+        with zipfile.ZipFile(tmp_path / "out.zip", "w", zipfile.ZIP_DEFLATED) as zipf:
+            results = add_files_to_zip(zipf, entries)
+
+        assert [checksum for _, checksum in results] == [None, None]
+
+    def test_large_files_are_streamed(self, tmp_path, monkeypatch):
+        """Test that files over the in-memory limit are streamed in order."""
+        pytest.importorskip("deflate")
+        monkeypatch.setattr(compression, "IN_MEMORY_LIMIT", 50)
+        entries = self._entries(tmp_path, 10)
+        zip_path = tmp_path / "out.zip"
+
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            add_files_to_zip(zipf, entries, max_workers=1)
+
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert zipf.testzip() is None
+            for file_path, zinfo in entries:
+                assert zipf.read(zinfo.filename) == file_path.read_bytes()
+                assert zipf.getinfo(zinfo.filename).date_time == zinfo.date_time
+
+    def test_deflate_entries_use_workers_without_fast_backends(self, tmp_path, monkeypatch):
+        """Test that zlib-only installs still compress DEFLATE entries on the worker pool."""
+        use_deflate_backend(monkeypatch, "zlib")
+        streamed = []
+        monkeypatch.setattr(
+            compression, "add_file_to_zip", lambda *args: streamed.append(args) or 0
+        )
+        prepared = []
+        real_prepare = compression._prepare_file
+
+        def tracking_prepare(*args):
+            prepared.append(threading.current_thread())
+            return real_prepare(*args)
+
+        monkeypatch.setattr(compression, "_prepare_file", tracking_prepare)
+        entries = self._entries(tmp_path, 5)
+        zip_path = tmp_path / "out.zip"
+
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            add_files_to_zip(zipf, entries, max_workers=2)
+
+        assert streamed == []
+        assert len(prepared) == 5
+        assert threading.main_thread() not in prepared
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert zipf.testzip() is None
+            for file_path, zinfo in entries:
+                assert zipf.getinfo(zinfo.filename).compress_type == zipfile.ZIP_DEFLATED
+                assert zipf.read(zinfo.filename) == file_path.read_bytes()
+
+    def test_stored_entries_prepared_on_workers(self, tmp_path, monkeypatch):
+        """Test that stored entries are prepared by workers, even without libdeflate."""
+        monkeypatch.setattr(compression, "deflate", None)
+        streamed = []
+        monkeypatch.setattr(
+            compression, "add_file_to_zip", lambda *args: streamed.append(args) or 0
+        )
+        image = tmp_path / "thumb.png"
+        image.write_bytes(os.urandom(5000))
+        zip_path = tmp_path / "out.zip"
+
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            results = add_files_to_zip(
+                zipf, [(image, zipfile.ZipInfo("thumb.png"))], hash_algorithm="sha256"
+            )
+
+        assert streamed == []
+        assert results == [(5000, hashlib.sha256(image.read_bytes()).hexdigest())]
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert zipf.testzip() is None
+            assert zipf.getinfo("thumb.png").compress_type == zipfile.ZIP_STORED
+            assert zipf.read("thumb.png") == image.read_bytes()
+
+    def test_in_flight_bytes_are_bounded(self, tmp_path, monkeypatch):
+        """Test that workers never hold more than IN_FLIGHT_LIMIT bytes of unwritten data."""
+        monkeypatch.setattr(compression, "IN_FLIGHT_LIMIT", 12000)
+        entries = []
+        for i in range(10):
+            image = tmp_path / f"thumb{i}.png"
+            image.write_bytes(os.urandom(5000))
+            entries.append((image, zipfile.ZipInfo.from_file(image, image.name)))
+
+        buffered = [0]
+        peak = [0]
+        real_prepare = compression._prepare_file
+        real_write = compression._write_raw_entry
+
+        def tracking_prepare(file_path, size_hint, *args):
+            buffered[0] += size_hint
+            peak[0] = max(peak[0], buffered[0])
+            return real_prepare(file_path, size_hint, *args)
+
+        def tracking_write(zipf, zinfo, *args):
+            buffered[0] -= zinfo.file_size
+            return real_write(zipf, zinfo, *args)
+
+        monkeypatch.setattr(compression, "_prepare_file", tracking_prepare)
+        monkeypatch.setattr(compression, "_write_raw_entry", tracking_write)
+
+        with zipfile.ZipFile(tmp_path / "out.zip", "w", zipfile.ZIP_DEFLATED) as zipf:
+            results = add_files_to_zip(zipf, entries, max_workers=4)
+
+        assert [size for size, _ in results] == [5000] * 10
+        assert 0 < peak[0] <= 12000
+
+
+class TestWriteZipEntry:
+    """Tests for write_zip_entry function."""
+
+    @pytest.mark.parametrize("backend", ["isal", "libdeflate"])
+    def test_fast_entries_are_valid(self, tmp_path, monkeypatch, backend):
+        """Test that isal- and libdeflate-compressed entries pass CRC checks."""
+        use_deflate_backend(monkeypatch, backend)
+        zip_path = tmp_path / "out.zip"
+        data = b"orca slicer profile " * 500
+
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=3) as zipf:
+            write_zip_entry(zipf, zipfile.ZipInfo("a/profile.json"), data)
+            write_zip_entry(zipf, zipfile.ZipInfo("empty.json"), b"")
+
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert zipf.testzip() is None
+            info = zipf.getinfo("a/profile.json")
+            assert info.compress_type == zipfile.ZIP_DEFLATED
+            assert info.compress_size < len(data)
+            assert zipf.read("a/profile.json") == data
+            assert zipf.read("empty.json") == b""
+
+    def test_compressed_format_is_stored(self, tmp_path):
+        """Test that an entry named like an image is stored without DEFLATE."""
+        zip_path = tmp_path / "out.zip"
+        data = b"\x89PNG" + b"\x00" * 500
+
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            write_zip_entry(zipf, zipfile.ZipInfo("thumb.png"), data)
+
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert zipf.getinfo("thumb.png").compress_type == zipfile.ZIP_STORED
+            assert zipf.read("thumb.png") == data
+
+    def test_mixed_with_streamed_entries(self, tmp_path, monkeypatch):
+        """Test that direct writes interleave correctly with streamed entries."""
+        pytest.importorskip("deflate")
+        monkeypatch.setattr(compression, "IN_MEMORY_LIMIT", 100)
+        small = tmp_path / "small.txt"
+        small.write_text("small")
+        large = tmp_path / "large.txt"
+        large.write_text("large " * 100)
+        zip_path = tmp_path / "out.zip"
+
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            add_file_to_zip(zipf, small, "small.txt")
+            add_file_to_zip(zipf, large, "large.txt")
+            add_file_to_zip(zipf, small, "again.txt")
+
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert zipf.testzip() is None
+            assert zipf.namelist() == ["small.txt", "large.txt", "again.txt"]
+            assert zipf.read("large.txt") == large.read_bytes()
+
+    def test_without_fast_backends(self, tmp_path, monkeypatch):
+        """Test the zlib fallback when neither isal nor libdeflate is installed."""
+        use_deflate_backend(monkeypatch, "zlib")
+        zip_path = tmp_path / "out.zip"
+
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            write_zip_entry(zipf, zipfile.ZipInfo("file.txt"), b"content")
+
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert zipf.getinfo("file.txt").compress_type == zipfile.ZIP_DEFLATED
+            assert zipf.read("file.txt") == b"content"
+
+    def test_stored_archive(self, tmp_path):
+        """Test that ZIP_STORED archives store entries uncompressed."""
+        zip_path = tmp_path / "out.zip"
+
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_STORED) as zipf:
+            write_zip_entry(zipf, zipfile.ZipInfo("file.txt"), b"content")
+
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert zipf.getinfo("file.txt").compress_type == zipfile.ZIP_STORED
+            assert zipf.read("file.txt") == b"content"
+
+
+class TestCompressDirectoryZst:
+    """Tests for compress_directory_zst function."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that a tar.zst archive extracts back to the original files."""
+        pytest.importorskip("zstandard")
+        source_dir = tmp_path / "source"
+        (source_dir / "user" / "filament").mkdir(parents=True)
+        (source_dir / "OrcaSlicer.conf").write_text('{"app": {}}')
+        (source_dir / "user" / "filament" / "pla.json").write_text('{"temp": 210}')
+
+        output_file = tmp_path / "backup.tar.zst"
+        result = compress_directory_zst(source_dir, output_file)
+
+        assert result == output_file
+        assert output_file.read_bytes()[:4] == b"\x28\xb5\x2f\xfd"  # zstd frame magic
+
+        extracted = extract_archive(output_file, tmp_path / "extracted")
+        assert (extracted / "OrcaSlicer.conf").read_text() == '{"app": {}}'
+        assert (extracted / "user" / "filament" / "pla.json").read_text() == '{"temp": 210}'
+
+    def test_uses_worker_threads(self, tmp_path, monkeypatch):
+        """Test that the compressor is created with one thread per CPU by default."""
+        zstandard = pytest.importorskip("zstandard")
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "file.txt").write_text("content")
+
+        created = []
+        real_compressor = zstandard.ZstdCompressor
+
+        def spy_compressor(**kwargs):
+            created.append(kwargs)
+            return real_compressor(**kwargs)
+
+        monkeypatch.setattr(compression.zstandard, "ZstdCompressor", spy_compressor)
+        monkeypatch.setattr(compression.os, "cpu_count", lambda: 3)
+
+        compress_directory_zst(source_dir, tmp_path / "backup.tar.zst", level=5)
+
+        assert created == [{"level": 5, "threads": 3}]
+
+    def test_single_threaded(self, tmp_path):
+        """Test that threads=0 still produces a valid archive."""
+        pytest.importorskip("zstandard")
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "file.txt").write_text("content")
+
+        output_file = compress_directory_zst(source_dir, tmp_path / "backup.tar.zst", threads=0)
+
+        extracted = extract_archive(output_file, tmp_path / "extracted")
+        assert (extracted / "file.txt").read_text() == "content"
+
+    def test_missing_zstandard(self, tmp_path, monkeypatch):
+        """Test that a clear error is raised without the optional dependency."""
+        monkeypatch.setattr(compression, "zstandard", None)
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+
+        with pytest.raises(RuntimeError, match="zstandard"):
+            compress_directory_zst(source_dir, tmp_path / "backup.tar.zst")
+
+    def test_zstd_available(self, monkeypatch):
+        """Test that zstd_available reflects the optional dependency."""
+        assert compression.zstd_available() is (compression.zstandard is not None)
+
+        monkeypatch.setattr(compression, "zstandard", None)
+
+        assert compression.zstd_available() is False
+
+
+class TestZstMetadata:
+    """Tests for append_zst_metadata and read_zst_metadata functions."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that appended metadata is read back without touching the stream."""
+        pytest.importorskip("zstandard")
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "file.txt").write_text("content")
+        output_file = compress_directory_zst(source_dir, tmp_path / "backup.tar.zst")
+
+        append_zst_metadata(output_file, b'{"slicer": "orcaslicer"}')
+
+        assert read_zst_metadata(output_file) == b'{"slicer": "orcaslicer"}'
+
+    def test_archive_still_extracts(self, tmp_path):
+        """Test that the skippable frame does not disturb extraction."""
+        pytest.importorskip("zstandard")
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "file.txt").write_text("content")
+        output_file = compress_directory_zst(source_dir, tmp_path / "backup.tar.zst")
+        append_zst_metadata(output_file, b"metadata")
+
+        extracted = extract_archive(output_file, tmp_path / "extracted")
+
+        assert (extracted / "file.txt").read_text() == "content"
+
+    @pytest.mark.parametrize("data", [b"", b"short", b"\x28\xb5\x2f\xfd" + b"x" * 64])
+    def test_missing_metadata(self, tmp_path, data):
+        """Test that files without a metadata frame return None."""
+        archive = tmp_path / "backup.tar.zst"
+        archive.write_bytes(data)
+
+        assert read_zst_metadata(archive) is None
+
+
+class TestArchiveDetection:
+    """Tests for is_archive and is_zstd_archive functions."""
+
+    def test_zstd_suffix(self, tmp_path):
+        """Test .tar.zst detection by name."""
+        assert is_zstd_archive(tmp_path / "backup.tar.zst") is True
+        assert is_zstd_archive(tmp_path / "backup.zip") is False
+
+    def test_is_archive(self, tmp_path):
+        """Test that only existing ZIP and tar.zst files are archives."""
+        zip_path = tmp_path / "backup.zip"
+        zip_path.write_bytes(b"")
+        zst_path = tmp_path / "backup.tar.zst"
+        zst_path.write_bytes(b"")
+        backup_dir = tmp_path / "backup_dir"
+        backup_dir.mkdir()
+
+        assert is_archive(zip_path) is True
+        assert is_archive(zst_path) is True
+        assert is_archive(backup_dir) is False
+        assert is_archive(tmp_path / "missing.zip") is False
+
 
 class TestExtractArchive:
     """Tests for extract_archive function."""
@@ -191,6 +893,58 @@ class TestExtractArchive:
 
         assert (output_dir / "binary.bin").read_bytes() == binary_data
 
+    def test_extract_large_deflated_file(self, tmp_path):
+        """Test that a file spanning many copy buffers is extracted intact."""
+        data = os.urandom(compression.BUFFER_SIZE) * 3 + b"tail"
+        archive_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            zipf.writestr("big.bin", data)
+
+        output_dir = tmp_path / "extracted"
+        extract_archive(archive_path, output_dir)
+
+        assert (output_dir / "big.bin").read_bytes() == data
+
+    def test_extract_directory_entries(self, tmp_path):
+        """Test that explicit directory entries are created, even when empty."""
+        archive_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(archive_path, "w") as zipf:
+            zipf.writestr("empty/", "")
+            zipf.writestr("dir/", "")
+            zipf.writestr("dir/file.txt", "content")
+
+        output_dir = tmp_path / "extracted"
+        extract_archive(archive_path, output_dir)
+
+        assert (output_dir / "empty").is_dir()
+        assert (output_dir / "dir" / "file.txt").read_text() == "content"
+
+    def test_extract_stays_inside_output_directory(self, tmp_path):
+        """Test that absolute and parent-relative member names cannot escape."""
+        archive_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(archive_path, "w") as zipf:
+            zipf.writestr("../escape.txt", "parent")
+            zipf.writestr("/abs/file.txt", "absolute")
+
+        output_dir = tmp_path / "out" / "extracted"
+        extract_archive(archive_path, output_dir)
+
+        assert not (tmp_path / "out" / "escape.txt").exists()
+        assert (output_dir / "escape.txt").read_text() == "parent"
+        assert (output_dir / "abs" / "file.txt").read_text() == "absolute"
+
+    def test_extract_repeated_name_keeps_last(self, tmp_path):
+        """Test that a name stored twice is written once, with the last entry."""
+        archive_path = tmp_path / "test.zip"
+        with pytest.warns(UserWarning), zipfile.ZipFile(archive_path, "w") as zipf:
+            zipf.writestr("file.txt", "first")
+            zipf.writestr("file.txt", "second")
+
+        output_dir = tmp_path / "extracted"
+        extract_archive(archive_path, output_dir)
+
+        assert (output_dir / "file.txt").read_text() == "second"
+
 
 class TestIsValidZip:
     """Tests for is_valid_zip function."""
@@ -257,4 +1011,17 @@ class TestIsValidZip:
             f.write(b"CORRUPTED")
 
         # testzip() should detect CRC mismatch
-        assert is_valid_zip(zip_path) is False
+        assert is_valid_zip(zip_path, fast=False) is False
+
+    def test_fast_check_skips_decompression(self, tmp_path, monkeypatch):
+        """Test that the default check reads only the central directory."""
+        zip_path = tmp_path / "valid.zip"
+        with zipfile.ZipFile(zip_path, "w") as zipf:
+            zipf.writestr("file.txt", "content")
+
+        def no_testzip(self):
+            raise AssertionError("testzip should not be called")
+
+        monkeypatch.setattr(zipfile.ZipFile, "testzip", no_testzip)
+
+        assert is_valid_zip(zip_path) is True
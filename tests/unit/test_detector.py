@@ -80,6 +80,22 @@ class TestGetSlicerPaths:
         with pytest.raises(RuntimeError, match="Unsupported platform"):
             get_slicer_paths()
 
+    def test_paths_are_cached(self, monkeypatch):
+        """Test that the platform lookup runs once per process."""
+        calls = []
+
+        def counting_system():
+            calls.append(1)
+            return "Linux"
+
+        monkeypatch.setattr("platform.system", counting_system)
+
+        first = get_slicer_paths()
+        second = get_slicer_paths()
+
+        assert first is second
+        assert len(calls) == 1
+
 
 class TestExtractVersion:
     """Tests for extract_version function."""
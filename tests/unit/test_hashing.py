@@ -0,0 +1,84 @@
+"""Unit tests for checksum utilities."""
+
+import hashlib
+import io
+
+import pytest
+
+from orca_backup.utils import hashing
+from orca_backup.utils.hashing import BUFFER_SIZE, calculate_digest, hash_stream, new_hasher
+
+
+class TestNewHasher:
+    """Tests for new_hasher function."""
+
+    def test_sha256(self):
+        """Test creating a SHA-256 hasher."""
+        hasher = new_hasher("sha256")
+        hasher.update(b"orca")
+
+        assert hasher.hexdigest() == hashlib.sha256(b"orca").hexdigest()
+
+    def test_xxh3(self):
+        """Test creating a 128-bit xxh3 hasher."""
+        xxhash = pytest.importorskip("xxhash")
+        hasher = new_hasher("xxh3")
+        hasher.update(b"orca")
+
+        assert hasher.hexdigest() == xxhash.xxh3_128(b"orca").hexdigest()
+        assert len(hasher.hexdigest()) == 32
+
+    def test_invalid_algorithm(self):
+        """Test that an unknown algorithm raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid hash algorithm"):
+            new_hasher("md5")
+
+    def test_missing_xxhash(self, monkeypatch):
+        """Test that a clear error is raised without the optional dependency."""
+        monkeypatch.setattr(hashing, "xxhash", None)
+
+        with pytest.raises(RuntimeError, match="xxhash"):
+            new_hasher("xxh3")
+
+
+class TestHashStream:
+    """Tests for hash_stream function."""
+
+    def test_sha256_spans_read_buffer(self):
+        """Test SHA-256 of a stream larger than the read buffer."""
+        data = b"orca" * (BUFFER_SIZE // 2)
+
+        assert hash_stream(io.BytesIO(data)) == hashlib.sha256(data).hexdigest()
+
+    def test_sha256_without_file_digest(self, monkeypatch):
+        """Test the chunked fallback used before Python 3.11."""
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+
+        assert hash_stream(io.BytesIO(b"orca")) == hashlib.sha256(b"orca").hexdigest()
+
+    def test_xxh3_spans_read_buffer(self):
+        """Test xxh3 of a stream larger than the read buffer."""
+        xxhash = pytest.importorskip("xxhash")
+        data = b"orca" * (BUFFER_SIZE // 2)
+
+        assert hash_stream(io.BytesIO(data), "xxh3") == xxhash.xxh3_128(data).hexdigest()
+
+
+class TestCalculateDigest:
+    """Tests for calculate_digest function."""
+
+    def test_default_is_sha256(self, tmp_path):
+        """Test that files are hashed with SHA-256 by default."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("Hello, World!")
+
+        expected = "dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f"
+        assert calculate_digest(test_file) == expected
+
+    def test_xxh3(self, tmp_path):
+        """Test hashing a file with xxh3."""
+        xxhash = pytest.importorskip("xxhash")
+        test_file = tmp_path / "test.bin"
+        test_file.write_bytes(b"\x00\x01\x02")
+
+        assert calculate_digest(test_file, "xxh3") == xxhash.xxh3_128(b"\x00\x01\x02").hexdigest()
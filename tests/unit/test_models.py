@@ -6,8 +6,9 @@ from pathlib import Path
 import pytest
 from pydantic import ValidationError
 
+from orca_backup.models import slicer as slicer_module
 from orca_backup.models.backup import BackupInfo, BackupManifest, FileEntry
-from orca_backup.models.slicer import SlicerInfo, SlicerType
+from orca_backup.models.slicer import SlicerInfo, SlicerType, clear_validity_cache
 
 
 class TestSlicerType:
@@ -187,6 +188,48 @@ class TestSlicerInfo:
 
         assert slicer.is_valid() is False
 
+    def _complete_slicer(self, tmp_path):
+        conf_file = tmp_path / "OrcaSlicer.conf"
+        conf_file.write_text("{}")
+        user_dir = tmp_path / "user"
+        user_dir.mkdir()
+        return SlicerInfo(
+            name=SlicerType.ORCASLICER,
+            display_name="OrcaSlicer",
+            config_path=tmp_path,
+            exists=True,
+            conf_file=conf_file,
+            user_dir=user_dir,
+        )
+
+    def test_is_valid_reuses_recent_check(self, tmp_path, monkeypatch):
+        """Test that a repeat is_valid() within the TTL does not stat again."""
+        slicer = self._complete_slicer(tmp_path)
+        assert slicer.is_valid() is True
+
+        def no_exists(self):
+            raise AssertionError("exists should not be called")
+
+        monkeypatch.setattr(Path, "exists", no_exists)
+
+        assert slicer.is_valid() is True
+
+    def test_is_valid_rechecks_after_ttl(self, tmp_path, monkeypatch):
+        """Test that an expired or cleared result is checked again."""
+        slicer = self._complete_slicer(tmp_path)
+        assert slicer.is_valid() is True
+        slicer.conf_file.unlink()
+
+        assert slicer.is_valid() is True
+        monkeypatch.setattr(slicer_module, "VALIDITY_TTL", 0.0)
+        assert slicer.is_valid() is False
+
+        slicer.conf_file.write_text("{}")
+        monkeypatch.setattr(slicer_module, "VALIDITY_TTL", 5.0)
+        assert slicer.is_valid() is False
+        clear_validity_cache()
+        assert slicer.is_valid() is True
+
 
 class TestFileEntry:
     """Tests for FileEntry model."""
@@ -205,13 +248,13 @@ class TestFileEntry:
 
     def test_required_fields(self):
         """Test that all fields are required."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(TypeError):
             FileEntry(path="test.txt", size=100)  # Missing sha256
 
-        with pytest.raises(ValidationError):
+        with pytest.raises(TypeError):
             FileEntry(path="test.txt", sha256="a" * 64)  # Missing size
 
-        with pytest.raises(ValidationError):
+        with pytest.raises(TypeError):
             FileEntry(size=100, sha256="a" * 64)  # Missing path
 
     def test_invalid_checksum_length(self):
@@ -220,6 +263,29 @@ class TestFileEntry:
         entry = FileEntry(path="test.txt", size=100, sha256="short")
         assert entry.sha256 == "short"
 
+    def test_slotted(self):
+        """Test that entries carry no per-instance __dict__."""
+        entry = FileEntry(path="test.txt", size=100, sha256="a" * 64)
+
+        assert not hasattr(entry, "__dict__")
+
+    def test_round_trip_through_manifest(self, sample_backup_manifest):
+        """Test that entries survive manifest serialization and validation."""
+        data = sample_backup_manifest.model_dump(mode="json")
+        assert data["files"][0] == {"path": "OrcaSlicer.conf", "size": 1024, "sha256": "a" * 64}
+
+        loaded = BackupManifest(**data)
+        assert all(isinstance(entry, FileEntry) for entry in loaded.files)
+        assert loaded.files == sample_backup_manifest.files
+
+    def test_manifest_validates_loaded_entries(self, sample_backup_manifest):
+        """Test that malformed entries in manifest data are rejected."""
+        data = sample_backup_manifest.model_dump(mode="json")
+        del data["files"][0]["sha256"]
+
+        with pytest.raises(ValidationError):
+            BackupManifest(**data)
+
 
 class TestBackupManifest:
     """Tests for BackupManifest model."""
@@ -260,6 +326,7 @@ class TestBackupManifest:
         assert manifest.version == "1.0"  # Default
         assert manifest.files == []  # Default empty list
         assert manifest.compressed is True  # Default
+        assert manifest.hash_algorithm == "sha256"  # Default, also for older manifests
 
     def test_size_mb_property(self):
         """Test size_mb property calculation."""
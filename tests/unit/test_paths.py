@@ -1,11 +1,23 @@
 """Unit tests for path utilities."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from orca_backup.utils.paths import ensure_directory, get_backup_name, get_default_backup_dir
+from orca_backup.utils.paths import (
+    PARALLEL_FANOUT,
+    ensure_directory,
+    get_backup_name,
+    get_default_backup_dir,
+    iter_file_stats,
+    iter_files,
+    iter_relative_files,
+    to_posix,
+)
 
 
 class TestEnsureDirectory:
@@ -51,6 +63,17 @@ class TestEnsureDirectory:
 
         assert isinstance(result, Path)
 
+    def test_skips_mkdir_for_known_directory(self, tmp_path, monkeypatch):
+        """Test that a directory ensured once is not re-created on later calls."""
+        new_dir = tmp_path / "cached"
+        ensure_directory(new_dir)
+
+        calls = []
+        monkeypatch.setattr(Path, "mkdir", lambda self, *a, **kw: calls.append(self))
+        ensure_directory(new_dir)
+
+        assert calls == []
+
 
 class TestGetBackupName:
     """Tests for get_backup_name function."""
@@ -69,6 +92,13 @@ class TestGetBackupName:
 
         assert name == "Orcaslicer_backup_2025-11-14_15-30-45"
 
+    def test_custom_extension(self):
+        """Test backup name with a non-ZIP archive extension."""
+        timestamp = datetime(2025, 11, 14, 15, 30, 45)
+        name = get_backup_name("orcaslicer", timestamp, compressed=True, extension=".tar.zst")
+
+        assert name == "Orcaslicer_backup_2025-11-14_15-30-45.tar.zst"
+
     def test_orca_flashforge_name(self):
         """Test backup name for Orca-Flashforge."""
         timestamp = datetime(2025, 11, 14, 15, 30, 45)
@@ -116,11 +146,158 @@ class TestGetBackupName:
 
         # Should replace hyphen with underscore
         assert "Orca_Flashforge_" in name
+
+    def test_preformatted_timestamp(self):
+        """Test that a timestamp string is used as-is, without formatting again."""
+        name = get_backup_name("orca-flashforge", "2025-11-14_12-00-00")
+
+        assert name == "Orca_Flashforge_backup_2025-11-14_12-00-00.zip"
         # Should not contain hyphens except in timestamp
         name_part = name.split("_backup_")[0]
         assert "-" not in name_part
 
 
+class TestIterFiles:
+    """Tests for iter_files function."""
+
+    def test_yields_nested_files_with_sizes(self, tmp_path):
+        """Test that files in nested directories are yielded with their sizes."""
+        (tmp_path / "a.txt").write_text("abc")
+        nested = tmp_path / "sub" / "deeper"
+        nested.mkdir(parents=True)
+        (nested / "b.txt").write_text("hello")
+
+        result = {
+            Path(path).relative_to(tmp_path).as_posix(): size for path, size in iter_files(tmp_path)
+        }
+
+        assert result == {"a.txt": 3, "sub/deeper/b.txt": 5}
+
+    def test_skips_directories(self, tmp_path):
+        """Test that empty directories are not yielded."""
+        (tmp_path / "empty").mkdir()
+
+        assert list(iter_files(tmp_path)) == []
+
+    def test_missing_root(self, tmp_path):
+        """Test that a missing root yields nothing."""
+        assert list(iter_files(tmp_path / "missing")) == []
+
+    def test_does_not_follow_directory_symlinks(self, tmp_path):
+        """Test that symlinked directories are not traversed."""
+        target = tmp_path / "target"
+        target.mkdir()
+        (target / "file.txt").write_text("x")
+        root = tmp_path / "root"
+        root.mkdir()
+        try:
+            (root / "link").symlink_to(target, target_is_directory=True)
+        except OSError:
+            pytest.skip("symlinks not supported")
+
+        assert list(iter_files(root)) == []
+
+    def test_exclude_patterns(self, tmp_path):
+        """Test that file patterns match names at any depth and "dir/" matches directories."""
+        (tmp_path / "keep" / "cache").mkdir(parents=True)
+        (tmp_path / "keep" / "a.json").write_text("{}")
+        (tmp_path / "keep" / "b.log").write_text("log")
+        (tmp_path / "keep" / "cache" / "c.json").write_text("{}")
+        (tmp_path / "cache").write_text("a file, not a directory")
+
+        result = sorted(
+            Path(path).relative_to(tmp_path).as_posix()
+            for path, _ in iter_files(tmp_path, exclude_patterns=["*.log", "cache/"])
+        )
+
+        assert result == ["cache", "keep/a.json"]
+
+    def test_wide_tree_scanned_in_parallel(self, tmp_path):
+        """Test that a tree wider than the fan-out threshold yields every file."""
+        expected = {}
+        for i in range(PARALLEL_FANOUT + 3):
+            nested = tmp_path / f"dir{i}" / "sub"
+            nested.mkdir(parents=True)
+            (nested / "file.txt").write_text("x" * i)
+            expected[f"dir{i}/sub/file.txt"] = i
+
+        with patch("orca_backup.utils.paths.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as pool:
+            result = {
+                Path(path).relative_to(tmp_path).as_posix(): size
+                for path, size in iter_files(tmp_path)
+            }
+
+        pool.assert_called_once()
+        assert result == expected
+
+    def test_narrow_tree_scanned_serially(self, tmp_path):
+        """Test that a narrow tree or workers=1 does not start a thread pool."""
+        for i in range(PARALLEL_FANOUT + 1):
+            (tmp_path / f"dir{i}").mkdir()
+            (tmp_path / f"dir{i}" / "file.txt").write_text("x")
+
+        with patch("orca_backup.utils.paths.ThreadPoolExecutor") as pool:
+            assert len(list(iter_files(tmp_path / "dir0"))) == 1
+            assert len(list(iter_files(tmp_path, workers=1))) == PARALLEL_FANOUT + 1
+
+        pool.assert_not_called()
+
+
+class TestIterFileStats:
+    """Tests for iter_file_stats function."""
+
+    def test_yields_scan_stat_results(self, tmp_path):
+        """Test that each file comes with the stat result from the scan."""
+        target = tmp_path / "a.txt"
+        target.write_text("abc")
+        os.utime(target, (1_600_000_000, 1_600_000_000))
+
+        [(path, stat)] = list(iter_file_stats(tmp_path))
+
+        assert path == str(target)
+        assert stat.st_size == 3
+        assert stat.st_mtime == 1_600_000_000
+
+
+class TestToPosix:
+    """Tests for to_posix function."""
+
+    def test_matches_as_posix(self):
+        """Test that native relative paths convert like Path.as_posix()."""
+        native = os.path.join("user", "default", "filament", "Generic PLA.json")
+
+        assert (
+            to_posix(native) == Path(native).as_posix() == "user/default/filament/Generic PLA.json"
+        )
+
+
+class TestIterRelativeFiles:
+    """Tests for iter_relative_files function."""
+
+    def test_yields_posix_relative_names(self, tmp_path):
+        """Test that each file comes with its "/"-separated name under the root."""
+        (tmp_path / "a.txt").write_text("abc")
+        (tmp_path / "sub" / "deeper").mkdir(parents=True)
+        (tmp_path / "sub" / "deeper" / "b.txt").write_text("hello")
+
+        result = sorted(
+            (path, relative, stat.st_size) for path, relative, stat in iter_relative_files(tmp_path)
+        )
+
+        assert result == [
+            (str(tmp_path / "a.txt"), "a.txt", 3),
+            (str(tmp_path / "sub" / "deeper" / "b.txt"), "sub/deeper/b.txt", 5),
+        ]
+
+    def test_root_with_trailing_separator(self, tmp_path):
+        """Test that a root given with a trailing separator is sliced correctly."""
+        (tmp_path / "file.txt").write_text("x")
+
+        result = list(iter_relative_files(str(tmp_path) + os.sep))
+
+        assert [relative for _, relative, _ in result] == ["file.txt"]
+
+
 class TestGetDefaultBackupDir:
     """Tests for get_default_backup_dir function."""
 
@@ -143,3 +320,19 @@ class TestGetDefaultBackupDir:
 
         assert result.parent == home
         assert result.name == "OrcaBackups"
+
+    def test_resolves_home_once(self, monkeypatch):
+        """Test that the home directory lookup is cached across calls."""
+        calls = []
+        real_home = Path.home
+
+        def counting_home():
+            calls.append(1)
+            return real_home()
+
+        monkeypatch.setattr(Path, "home", counting_home)
+        first = get_default_backup_dir()
+        second = get_default_backup_dir()
+
+        assert first == second
+        assert len(calls) == 1
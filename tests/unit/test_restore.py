@@ -1,16 +1,27 @@
 """Unit tests for backup restore."""
 
+import hashlib
+import io
 import json
+import os
+import tarfile
 import zipfile
 from datetime import datetime
 from pathlib import Path
 
 import pytest
 
-from orca_backup.core.restore import get_restore_file_list, restore_backup
+from orca_backup.core import restore
+from orca_backup.core.restore import (
+    _copy_file,
+    _write_stream,
+    get_restore_file_list,
+    restore_backup,
+)
 from orca_backup.core.verify import calculate_sha256
 from orca_backup.models.backup import BackupManifest, FileEntry
 from orca_backup.models.slicer import SlicerType
+from orca_backup.utils.compression import PREALLOCATE_MIN_SIZE, create_zst_tar
 
 
 class TestGetRestoreFileList:
@@ -78,6 +89,165 @@ class TestGetRestoreFileList:
         with pytest.raises(ValueError, match="Could not load backup manifest"):
             get_restore_file_list(backup_dir)
 
+    def test_get_file_list_with_slicer_and_manifest(self, tmp_path, monkeypatch):
+        """Test that a supplied slicer and manifest skip detection and loading."""
+        from orca_backup.models.slicer import SlicerInfo
+
+        manifest = BackupManifest(
+            created_at=datetime.now(),
+            slicer="orcaslicer",
+            platform="linux",
+            files=[FileEntry(path="OrcaSlicer.conf", size=100, sha256="a" * 64)],
+            total_files=1,
+            total_size=100,
+        )
+        config_path = tmp_path / "OrcaSlicer"
+        slicer = SlicerInfo(
+            name=SlicerType.ORCASLICER,
+            display_name="OrcaSlicer",
+            config_path=config_path,
+            exists=True,
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("should not be called")
+
+        monkeypatch.setattr("orca_backup.core.restore.get_slicer_info", fail)
+        monkeypatch.setattr("orca_backup.core.restore.load_manifest", fail)
+
+        file_list = get_restore_file_list(tmp_path / "missing", slicer=slicer, manifest=manifest)
+
+        assert file_list == [(Path("OrcaSlicer.conf"), config_path / "OrcaSlicer.conf")]
+
+    @pytest.mark.parametrize(
+        "path",
+        ["../../PWNED", "user/../../PWNED", "/etc/PWNED", "C:/PWNED", "..\\PWNED", ""],
+    )
+    def test_get_file_list_rejects_unsafe_paths(self, tmp_path, path):
+        """Test that manifest paths escaping the config directory are rejected."""
+        from orca_backup.models.slicer import SlicerInfo
+
+        manifest = BackupManifest(
+            created_at=datetime.now(),
+            slicer="orcaslicer",
+            platform="linux",
+            files=[FileEntry(path=path, size=1, sha256="a" * 64)],
+            total_files=1,
+            total_size=1,
+        )
+        slicer = SlicerInfo(
+            name=SlicerType.ORCASLICER,
+            display_name="OrcaSlicer",
+            config_path=tmp_path / "OrcaSlicer",
+            exists=True,
+        )
+
+        with pytest.raises(ValueError, match="Unsafe path"):
+            get_restore_file_list(tmp_path, slicer=slicer, manifest=manifest)
+
+
+class TestWriteStream:
+    """Tests for _write_stream function."""
+
+    def test_writes_content(self, tmp_path):
+        """Test that the stream is written to a new nested file."""
+        dst = tmp_path / "a" / "b" / "file.bin"
+
+        _write_stream(io.BytesIO(b"payload"), dst, size=7)
+
+        assert dst.read_bytes() == b"payload"
+
+    def test_truncates_overstated_size(self, tmp_path):
+        """Test that preallocated space beyond the real content is trimmed."""
+        dst = tmp_path / "file.bin"
+
+        _write_stream(io.BytesIO(b"short"), dst, size=4096)
+
+        assert dst.read_bytes() == b"short"
+
+    def test_preallocates_when_supported(self, tmp_path, monkeypatch):
+        """Test that posix_fallocate is called with the expected size."""
+        calls = []
+        monkeypatch.setattr(
+            restore.os, "posix_fallocate", lambda fd, offset, size: calls.append(size), raising=False
+        )
+
+        _write_stream(io.BytesIO(b"data"), tmp_path / "file.bin", size=PREALLOCATE_MIN_SIZE)
+
+        assert calls == [PREALLOCATE_MIN_SIZE]
+
+    def test_without_posix_fallocate(self, tmp_path, monkeypatch):
+        """Test writing on platforms without posix_fallocate."""
+        monkeypatch.delattr(os, "posix_fallocate", raising=False)
+        dst = tmp_path / "file.bin"
+
+        _write_stream(io.BytesIO(b"data"), dst, size=4)
+
+        assert dst.read_bytes() == b"data"
+
+
+class TestCopyFile:
+    """Tests for _copy_file function."""
+
+    def test_copies_content_and_mtime(self, tmp_path):
+        """Test that content and modification time are preserved."""
+        src = tmp_path / "src.json"
+        src.write_bytes(b"x" * 70000)
+        os.utime(src, (1_600_000_000, 1_600_000_000))
+        dst = tmp_path / "dst.json"
+
+        _copy_file(src, dst)
+
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime == src.stat().st_mtime
+
+    def test_empty_file(self, tmp_path):
+        """Test copying an empty file."""
+        src = tmp_path / "empty.json"
+        src.write_bytes(b"")
+        dst = tmp_path / "dst.json"
+
+        _copy_file(src, dst)
+
+        assert dst.read_bytes() == b""
+
+    def test_falls_back_to_copy2(self, tmp_path, monkeypatch):
+        """Test the fallback when copy_file_range is refused."""
+
+        def refuse(*args):
+            raise OSError("cross-device")
+
+        monkeypatch.setattr(os, "copy_file_range", refuse, raising=False)
+        src = tmp_path / "src.json"
+        src.write_text("content")
+        dst = tmp_path / "dst.json"
+
+        _copy_file(src, dst)
+
+        assert dst.read_text() == "content"
+
+    def test_falls_back_when_nothing_is_copied(self, tmp_path, monkeypatch):
+        """Test the fallback when copy_file_range reports EOF on a non-empty file."""
+        monkeypatch.setattr(os, "copy_file_range", lambda *args: 0, raising=False)
+        src = tmp_path / "src.json"
+        src.write_text("content")
+        dst = tmp_path / "dst.json"
+
+        _copy_file(src, dst)
+
+        assert dst.read_text() == "content"
+
+    def test_without_copy_file_range(self, tmp_path, monkeypatch):
+        """Test copying on platforms without copy_file_range."""
+        monkeypatch.delattr(os, "copy_file_range", raising=False)
+        src = tmp_path / "src.json"
+        src.write_text("content")
+        dst = tmp_path / "dst.json"
+
+        _copy_file(src, dst)
+
+        assert dst.read_text() == "content"
+
 
 class TestRestoreBackup:
     """Tests for restore_backup function."""
@@ -141,7 +311,7 @@ class TestRestoreBackup:
         monkeypatch.setattr(
             "orca_backup.core.restore.get_slicer_info", mock_get_slicer_info
         )
-        monkeypatch.setattr("orca_backup.core.restore.verify_backup", lambda p, verbose=False: True)
+        monkeypatch.setattr("orca_backup.core.restore.verify_backup", lambda p, **kwargs: True)
 
         success = restore_backup(backup_dir, backup_existing=False)
 
@@ -203,13 +373,74 @@ class TestRestoreBackup:
         monkeypatch.setattr(
             "orca_backup.core.restore.get_slicer_info", mock_get_slicer_info
         )
-        monkeypatch.setattr("orca_backup.core.restore.verify_backup", lambda p, verbose=False: True)
+        monkeypatch.setattr("orca_backup.core.restore.verify_backup", lambda p, **kwargs: True)
 
         success = restore_backup(zip_path, backup_existing=False)
 
         assert success is True
         assert (target_dir / "OrcaSlicer.conf").exists()
 
+    @pytest.mark.parametrize("kind", ["zip", "tar.zst", "directory"])
+    def test_restore_rejects_path_traversal(self, tmp_path, monkeypatch, kind):
+        """Test that a verified backup cannot write outside the slicer config directory."""
+        if kind == "tar.zst":
+            pytest.importorskip("zstandard")
+        payload = b"pwned"
+        manifest = BackupManifest(
+            created_at=datetime.now(),
+            slicer="orcaslicer",
+            platform="linux",
+            files=[
+                FileEntry(
+                    path="../../PWNED",
+                    size=len(payload),
+                    sha256=hashlib.sha256(payload).hexdigest(),
+                )
+            ],
+            total_files=1,
+            total_size=len(payload),
+        )
+        manifest_data = manifest.model_dump_json().encode()
+
+        if kind == "zip":
+            backup_path = tmp_path / "evil.zip"
+            with zipfile.ZipFile(backup_path, "w") as zipf:
+                zipf.writestr("../../PWNED", payload)
+                zipf.writestr("backup_manifest.json", manifest_data)
+        elif kind == "tar.zst":
+            backup_path = tmp_path / "evil.tar.zst"
+            with create_zst_tar(backup_path) as tar:
+                for name, data in (
+                    ("../../PWNED", payload),
+                    ("backup_manifest.json", manifest_data),
+                ):
+                    tarinfo = tarfile.TarInfo(name)
+                    tarinfo.size = len(data)
+                    tar.addfile(tarinfo, io.BytesIO(data))
+        else:
+            backup_path = tmp_path / "a" / "b" / "evil"
+            backup_path.mkdir(parents=True)
+            (backup_path / "backup_manifest.json").write_bytes(manifest_data)
+            (tmp_path / "a" / "PWNED").write_bytes(payload)
+
+        # ../../PWNED from here is a/b/PWNED, distinct from the directory backup's source
+        target_dir = tmp_path / "a" / "b" / "c" / "OrcaSlicer"
+        target_dir.mkdir(parents=True)
+
+        def mock_get_slicer_info(slicer_type):
+            from orca_backup.models.slicer import SlicerInfo
+
+            return SlicerInfo(
+                name=slicer_type, display_name="OrcaSlicer", config_path=target_dir, exists=True
+            )
+
+        monkeypatch.setattr("orca_backup.core.restore.get_slicer_info", mock_get_slicer_info)
+
+        with pytest.raises(ValueError, match="Unsafe path"):
+            restore_backup(backup_path, backup_existing=False)
+
+        assert not (tmp_path / "a" / "b" / "PWNED").exists()
+
     def test_restore_dry_run(self, tmp_path, monkeypatch, capsys):
         """Test dry-run mode doesn't modify files."""
         # Create backup
@@ -255,7 +486,7 @@ class TestRestoreBackup:
         monkeypatch.setattr(
             "orca_backup.core.restore.get_slicer_info", mock_get_slicer_info
         )
-        monkeypatch.setattr("orca_backup.core.restore.verify_backup", lambda p, verbose=False: True)
+        monkeypatch.setattr("orca_backup.core.restore.verify_backup", lambda p, **kwargs: True)
 
         success = restore_backup(backup_dir, dry_run=True, backup_existing=False)
 
@@ -272,11 +503,88 @@ class TestRestoreBackup:
         backup_dir = tmp_path / "backup"
         backup_dir.mkdir()
 
-        monkeypatch.setattr("orca_backup.core.restore.verify_backup", lambda p, verbose=False: False)
+        monkeypatch.setattr("orca_backup.core.restore.verify_backup", lambda p, **kwargs: False)
 
         with pytest.raises(ValueError, match="Backup verification failed"):
             restore_backup(backup_dir)
 
+    @pytest.mark.parametrize(
+        "kwargs", [{"dry_run": True}, {"skip_verify": True}], ids=["dry_run", "skip_verify"]
+    )
+    def test_restore_skips_verification(self, tmp_path, monkeypatch, kwargs):
+        """Test that dry runs and pre-verified restores do not verify again."""
+        backup_dir = tmp_path / "backup"
+        backup_dir.mkdir()
+        manifest = BackupManifest(
+            created_at=datetime.now(),
+            slicer="orcaslicer",
+            platform="linux",
+            files=[],
+            total_files=0,
+            total_size=0,
+        )
+        (backup_dir / "backup_manifest.json").write_text(manifest.model_dump_json())
+
+        target_dir = tmp_path / "target" / "OrcaSlicer"
+        target_dir.mkdir(parents=True)
+
+        def mock_get_slicer_info(slicer_type):
+            from orca_backup.models.slicer import SlicerInfo
+
+            return SlicerInfo(
+                name=slicer_type,
+                display_name="OrcaSlicer",
+                config_path=target_dir,
+                exists=True,
+            )
+
+        def fail_verify(p, **kwargs):
+            raise AssertionError("verify_backup should not be called")
+
+        monkeypatch.setattr("orca_backup.core.restore.get_slicer_info", mock_get_slicer_info)
+        monkeypatch.setattr("orca_backup.core.restore.verify_backup", fail_verify)
+
+        assert restore_backup(backup_dir, backup_existing=False, **kwargs) is True
+
+    def test_restore_passes_loaded_manifest_to_verify(self, tmp_path, monkeypatch):
+        """Test that the manifest is loaded once and reused for verification."""
+        backup_dir = tmp_path / "backup"
+        backup_dir.mkdir()
+        manifest = BackupManifest(
+            created_at=datetime.now(),
+            slicer="orcaslicer",
+            platform="linux",
+            files=[],
+            total_files=0,
+            total_size=0,
+        )
+        (backup_dir / "backup_manifest.json").write_text(manifest.model_dump_json())
+
+        target_dir = tmp_path / "target" / "OrcaSlicer"
+        target_dir.mkdir(parents=True)
+
+        def mock_get_slicer_info(slicer_type):
+            from orca_backup.models.slicer import SlicerInfo
+
+            return SlicerInfo(
+                name=slicer_type,
+                display_name="OrcaSlicer",
+                config_path=target_dir,
+                exists=True,
+            )
+
+        verified = []
+
+        def record_verify(p, verbose=False, manifest=None):
+            verified.append(manifest)
+            return True
+
+        monkeypatch.setattr("orca_backup.core.restore.get_slicer_info", mock_get_slicer_info)
+        monkeypatch.setattr("orca_backup.core.restore.verify_backup", record_verify)
+
+        assert restore_backup(backup_dir, backup_existing=False) is True
+        assert verified == [manifest]
+
     def test_restore_slicer_not_found(self, tmp_path, monkeypatch):
         """Test that non-existent target slicer raises ValueError."""
         backup_dir = tmp_path / "backup"
@@ -309,12 +617,13 @@ class TestRestoreBackup:
         monkeypatch.setattr(
             "orca_backup.core.restore.get_slicer_info", mock_get_slicer_info
         )
-        monkeypatch.setattr("orca_backup.core.restore.verify_backup", lambda p, verbose=False: True)
+        monkeypatch.setattr("orca_backup.core.restore.verify_backup", lambda p, **kwargs: True)
 
         with pytest.raises(ValueError, match="not found"):
             restore_backup(backup_dir)
 
-    def test_restore_with_backup_existing(self, tmp_path, monkeypatch, capsys):
+    @pytest.mark.parametrize("zstd", [True, False])
+    def test_restore_with_backup_existing(self, tmp_path, monkeypatch, capsys, zstd):
         """Test that existing config is backed up before restore."""
         # Create backup to restore from
         backup_dir = tmp_path / "backup"
@@ -369,22 +678,27 @@ class TestRestoreBackup:
         # Mock create_backup to avoid actual backup
         backup_created = []
 
-        def mock_create_backup(slicer, output_dir, compress, verify):
+        def mock_create_backup(slicer, output_dir, compress, verify, archive_format="zip"):
             backup_path = output_dir / "backup.zip"
             backup_path.write_text("mock backup")
             backup_created.append(backup_path)
+            formats.append(archive_format)
             return backup_path
 
+        formats = []
+        monkeypatch.setattr("orca_backup.core.restore.zstd_available", lambda: zstd)
+
         monkeypatch.setattr(
             "orca_backup.core.restore.get_slicer_info", mock_get_slicer_info
         )
-        monkeypatch.setattr("orca_backup.core.restore.verify_backup", lambda p, verbose=False: True)
+        monkeypatch.setattr("orca_backup.core.restore.verify_backup", lambda p, **kwargs: True)
         monkeypatch.setattr("orca_backup.core.restore.create_backup", mock_create_backup)
 
         restore_backup(backup_dir, backup_existing=True)
 
-        # Verify backup was created
+        # Verify backup was created, as tar.zst when zstandard is available
         assert len(backup_created) == 1
+        assert formats == ["tar.zst" if zstd else "zip"]
         captured = capsys.readouterr()
         assert "Creating backup of existing configuration" in captured.out
 
@@ -426,7 +740,7 @@ class TestRestoreBackup:
         monkeypatch.setattr(
             "orca_backup.core.restore.get_slicer_info", mock_get_slicer_info
         )
-        monkeypatch.setattr("orca_backup.core.restore.verify_backup", lambda p, verbose=False: True)
+        monkeypatch.setattr("orca_backup.core.restore.verify_backup", lambda p, **kwargs: True)
 
         success = restore_backup(backup_dir, backup_existing=False)
 
@@ -486,9 +800,56 @@ class TestRestoreBackup:
         monkeypatch.setattr(
             "orca_backup.core.restore.get_slicer_info", mock_get_slicer_info
         )
-        monkeypatch.setattr("orca_backup.core.restore.verify_backup", lambda p, verbose=False: True)
+        monkeypatch.setattr("orca_backup.core.restore.verify_backup", lambda p, **kwargs: True)
 
         restore_backup(backup_dir, slicer_type=None, backup_existing=False)
 
         # Should have auto-detected orca-flashforge
         assert SlicerType.ORCA_FLASHFORGE in called_with
+
+    def test_restore_zip_streams_nested_entries(self, tmp_path, monkeypatch, capsys):
+        """Test that ZIP entries stream to nested destinations and missing ones warn."""
+        files = {f"user/default/filament/f{i}.json": f'{{"id": {i}}}' for i in range(20)}
+        entries = [
+            FileEntry(path=name, size=len(data), sha256="a" * 64) for name, data in files.items()
+        ]
+        entries.append(FileEntry(path="user/missing.json", size=1, sha256="a" * 64))
+        manifest = BackupManifest(
+            created_at=datetime.now(),
+            slicer="orcaslicer",
+            platform="linux",
+            files=entries,
+            total_files=len(entries),
+            total_size=sum(e.size for e in entries),
+        )
+
+        zip_path = tmp_path / "backup.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            for name, data in files.items():
+                zipf.writestr(name, data)
+            zipf.writestr("backup_manifest.json", manifest.model_dump_json())
+
+        target_dir = tmp_path / "target" / "OrcaSlicer"
+        target_dir.mkdir(parents=True)
+
+        def mock_get_slicer_info(slicer_type):
+            from orca_backup.models.slicer import SlicerInfo
+
+            return SlicerInfo(
+                name=slicer_type,
+                display_name="OrcaSlicer",
+                config_path=target_dir,
+                exists=True,
+            )
+
+        monkeypatch.setattr("orca_backup.core.restore.get_slicer_info", mock_get_slicer_info)
+        monkeypatch.setattr("orca_backup.core.restore.verify_backup", lambda p, **kwargs: True)
+
+        success = restore_backup(zip_path, backup_existing=False)
+
+        assert success is False
+        for name, data in files.items():
+            assert (target_dir / name).read_text() == data
+        captured = capsys.readouterr()
+        assert f"WARNING: File not found in backup: {Path('user/missing.json')}" in captured.out
+        assert "Restored 20/21 files" in captured.out
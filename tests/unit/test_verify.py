@@ -1,6 +1,9 @@
 """Unit tests for backup verification."""
 
+import hashlib
+import io
 import json
+import tarfile
 import zipfile
 from datetime import datetime
 from pathlib import Path
@@ -8,12 +11,15 @@ from pathlib import Path
 import pytest
 
 from orca_backup.core.verify import (
+    _check_file,
     calculate_sha256,
     get_backup_info,
     load_manifest,
     verify_backup,
 )
 from orca_backup.models.backup import BackupManifest, FileEntry
+from orca_backup.utils.compression import append_zst_metadata, create_zst_tar
+from orca_backup.utils.hashing import BUFFER_SIZE
 
 
 class TestCalculateSha256:
@@ -61,6 +67,24 @@ class TestCalculateSha256:
 
         assert len(checksum) == 64
 
+    def test_calculate_checksum_spans_read_buffer(self, tmp_path):
+        """Test that files larger than the read buffer hash correctly."""
+        data = b"orca" * (BUFFER_SIZE // 2)
+        test_file = tmp_path / "big.bin"
+        test_file.write_bytes(data)
+
+        assert calculate_sha256(test_file) == hashlib.sha256(data).hexdigest()
+
+    def test_calculate_checksum_without_file_digest(self, tmp_path, monkeypatch):
+        """Test the chunked fallback used before Python 3.11."""
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("Hello, World!")
+
+        checksum = calculate_sha256(test_file)
+
+        assert checksum == "dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f"
+
     def test_consistent_checksums(self, tmp_path):
         """Test that checksums are consistent across calls."""
         test_file = tmp_path / "test.txt"
@@ -72,6 +96,32 @@ class TestCalculateSha256:
         assert checksum1 == checksum2
 
 
+class TestCheckFile:
+    """Tests for the _check_file verification worker."""
+
+    def test_statuses(self, tmp_path):
+        """Test ok, mismatch and missing results."""
+        test_file = tmp_path / "file.txt"
+        test_file.write_text("content")
+        checksum = calculate_sha256(test_file)
+
+        def open_entry(path):
+            return open(tmp_path / path, "rb")
+
+        assert _check_file(open_entry, "file.txt", checksum) == ("file.txt", "ok")
+        assert _check_file(open_entry, "file.txt", "0" * 64) == ("file.txt", "mismatch")
+        assert _check_file(open_entry, "gone.txt", checksum) == ("gone.txt", "missing")
+
+    def test_missing_zip_entry(self, tmp_path):
+        """Test that a name absent from a ZIP is reported as missing."""
+        zip_path = tmp_path / "backup.zip"
+        with zipfile.ZipFile(zip_path, "w") as zipf:
+            zipf.writestr("present.txt", "content")
+
+        with zipfile.ZipFile(zip_path, "r") as zipf:
+            assert _check_file(zipf.open, "absent.txt", "0" * 64) == ("absent.txt", "missing")
+
+
 class TestLoadManifest:
     """Tests for load_manifest function."""
 
@@ -107,6 +157,41 @@ class TestLoadManifest:
         assert loaded.slicer == sample_backup_manifest.slicer
         assert loaded.total_files == sample_backup_manifest.total_files
 
+    def test_load_from_zstd_archive_skips_decompression(
+        self, tmp_path, sample_backup_manifest, monkeypatch
+    ):
+        """Test that a tar.zst manifest is read from the trailer without decompressing."""
+        pytest.importorskip("zstandard")
+        archive = tmp_path / "backup.tar.zst"
+        data = sample_backup_manifest.model_dump_json().encode()
+        with create_zst_tar(archive) as tar:
+            tarinfo = tarfile.TarInfo("backup_manifest.json")
+            tarinfo.size = len(data)
+            tar.addfile(tarinfo, io.BytesIO(data))
+        append_zst_metadata(archive, data)
+
+        def fail_open(path):
+            raise AssertionError("open_zst_tar should not be called")
+
+        monkeypatch.setattr("orca_backup.core.verify.open_zst_tar", fail_open)
+        loaded = load_manifest(archive)
+
+        assert loaded == sample_backup_manifest
+
+    def test_load_from_zstd_archive_without_trailer(self, tmp_path, sample_backup_manifest):
+        """Test that older tar.zst archives fall back to scanning the stream."""
+        pytest.importorskip("zstandard")
+        archive = tmp_path / "backup.tar.zst"
+        data = sample_backup_manifest.model_dump_json().encode()
+        with create_zst_tar(archive) as tar:
+            tarinfo = tarfile.TarInfo("backup_manifest.json")
+            tarinfo.size = len(data)
+            tar.addfile(tarinfo, io.BytesIO(data))
+
+        loaded = load_manifest(archive)
+
+        assert loaded == sample_backup_manifest
+
     def test_load_missing_manifest_in_directory(self, tmp_path):
         """Test loading from directory without manifest."""
         backup_dir = tmp_path / "backup"
@@ -233,6 +318,58 @@ class TestVerifyBackup:
 
         assert is_valid is True
 
+    def test_verify_zip_without_extracting(self, tmp_path, monkeypatch):
+        """Test that ZIP backups are hashed from the archive, not an extracted copy."""
+
+        def no_extract(*args, **kwargs):
+            raise AssertionError("archive should not be extracted")
+
+        monkeypatch.setattr(zipfile.ZipFile, "extractall", no_extract)
+        monkeypatch.setattr(zipfile.ZipFile, "extract", no_extract)
+
+        content = b"profile data"
+        manifest = BackupManifest(
+            created_at=datetime.now(),
+            slicer="orcaslicer",
+            platform="linux",
+            files=[
+                FileEntry(
+                    path="user/profile.json",
+                    size=len(content),
+                    sha256=hashlib.sha256(content).hexdigest(),
+                )
+            ],
+            total_files=1,
+            total_size=len(content),
+        )
+        zip_path = tmp_path / "backup.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            zipf.writestr("user/profile.json", content)
+            zipf.writestr(
+                "backup_manifest.json", json.dumps(manifest.model_dump(mode="json"))
+            )
+
+        assert verify_backup(zip_path) is True
+
+    def test_verify_zip_checksum_mismatch(self, tmp_path):
+        """Test that a tampered ZIP entry fails verification."""
+        manifest = BackupManifest(
+            created_at=datetime.now(),
+            slicer="orcaslicer",
+            platform="linux",
+            files=[FileEntry(path="file.txt", size=8, sha256="0" * 64)],
+            total_files=1,
+            total_size=8,
+        )
+        zip_path = tmp_path / "backup.zip"
+        with zipfile.ZipFile(zip_path, "w") as zipf:
+            zipf.writestr("file.txt", "tampered")
+            zipf.writestr(
+                "backup_manifest.json", json.dumps(manifest.model_dump(mode="json"))
+            )
+
+        assert verify_backup(zip_path) is False
+
     def test_verify_nonexistent_backup(self, tmp_path):
         """Test verifying non-existent backup."""
         nonexistent = tmp_path / "nonexistent.zip"
@@ -250,6 +387,14 @@ class TestVerifyBackup:
 
         assert is_valid is False
 
+    def test_verify_corrupted_zstd_archive(self, tmp_path):
+        """Test that a corrupted tar.zst backup fails verification."""
+        pytest.importorskip("zstandard")
+        backup_path = tmp_path / "backup.tar.zst"
+        backup_path.write_bytes(b"not a zstd stream")
+
+        assert verify_backup(backup_path) is False
+
     def test_verify_missing_manifest(self, tmp_path):
         """Test verifying backup without manifest."""
         backup_dir = tmp_path / "backup"
@@ -287,6 +432,60 @@ class TestVerifyBackup:
 
         assert is_valid is False
 
+    def test_verify_missing_file_skips_hashing(self, tmp_path, monkeypatch):
+        """Test that a missing file fails non-verbose verification before any hashing."""
+        backup_dir = tmp_path / "backup"
+        backup_dir.mkdir()
+        present = backup_dir / "present.txt"
+        present.write_text("content")
+
+        manifest = BackupManifest(
+            created_at=datetime.now(),
+            slicer="orcaslicer",
+            platform="linux",
+            files=[
+                FileEntry(path="present.txt", size=7, sha256=calculate_sha256(present)),
+                FileEntry(path="missing.txt", size=100, sha256="a" * 64),
+            ],
+            total_files=2,
+            total_size=107,
+        )
+        (backup_dir / "backup_manifest.json").write_text(manifest.model_dump_json())
+
+        hashed = []
+        monkeypatch.setattr(
+            "orca_backup.core.verify.hash_stream", lambda f, algorithm: hashed.append(f)
+        )
+
+        assert verify_backup(backup_dir, verbose=False) is False
+        assert hashed == []
+
+    def test_verify_zip_missing_entry_skips_hashing(self, tmp_path, monkeypatch):
+        """Test that a missing ZIP entry is found from the namelist alone."""
+        zip_path = tmp_path / "backup.zip"
+        manifest = BackupManifest(
+            created_at=datetime.now(),
+            slicer="orcaslicer",
+            platform="linux",
+            files=[
+                FileEntry(path="present.txt", size=7, sha256="a" * 64),
+                FileEntry(path="missing.txt", size=100, sha256="a" * 64),
+            ],
+            total_files=2,
+            total_size=107,
+        )
+        with zipfile.ZipFile(zip_path, "w") as zipf:
+            zipf.writestr("present.txt", "content")
+            zipf.writestr("backup_manifest.json", manifest.model_dump_json())
+
+        hashed = []
+        monkeypatch.setattr(
+            "orca_backup.core.verify.hash_stream", lambda f, algorithm: hashed.append(f)
+        )
+
+        assert verify_backup(zip_path, verbose=False) is False
+        assert hashed == []
+
     def test_verify_checksum_mismatch(self, tmp_path):
         """Test verifying backup with checksum mismatch."""
         backup_dir = tmp_path / "backup"
@@ -320,6 +519,39 @@ class TestVerifyBackup:
 
         assert is_valid is False
 
+    def test_verify_verbose_reports_every_mismatch(self, tmp_path, capsys):
+        """Test that verbose mode hashes every file and reports all mismatches."""
+        backup_dir = tmp_path / "backup"
+        backup_dir.mkdir()
+
+        entries = []
+        for i in range(20):
+            file_path = backup_dir / f"file{i}.txt"
+            file_path.write_text(f"content {i}")
+            checksum = "0" * 64 if i % 5 == 0 else calculate_sha256(file_path)
+            entries.append(
+                FileEntry(path=file_path.name, size=file_path.stat().st_size, sha256=checksum)
+            )
+
+        manifest = BackupManifest(
+            created_at=datetime.now(),
+            slicer="orcaslicer",
+            platform="linux",
+            files=entries,
+            total_files=len(entries),
+            total_size=sum(e.size for e in entries),
+        )
+        (backup_dir / "backup_manifest.json").write_text(
+            json.dumps(manifest.model_dump(mode="json"), default=str)
+        )
+
+        assert verify_backup(backup_dir, verbose=True) is False
+
+        captured = capsys.readouterr()
+        assert "Checksum mismatches: 4" in captured.out
+        # Reported in manifest order
+        assert captured.out.index("file0.txt") < captured.out.index("file5.txt")
+
     def test_verify_verbose_output(self, tmp_path, capsys):
         """Test verbose output during verification."""
         backup_dir = tmp_path / "backup"
@@ -386,7 +618,7 @@ class TestGetBackupInfo:
             json.dumps(manifest.model_dump(mode="json"), default=str)
         )
 
-        info = get_backup_info(backup_dir)
+        info = get_backup_info(backup_dir, verify=True)
 
         assert info is not None
         assert info.backup_path == backup_dir
@@ -394,6 +626,40 @@ class TestGetBackupInfo:
         assert info.is_valid is True
         assert info.size_mb > 0
 
+    def test_get_info_skips_verification_by_default(self, tmp_path, monkeypatch):
+        """Test that get_backup_info only verifies when asked."""
+        backup_dir = tmp_path / "backup"
+        backup_dir.mkdir()
+
+        manifest = BackupManifest(
+            created_at=datetime.now(),
+            slicer="orcaslicer",
+            platform="linux",
+            files=[FileEntry(path="missing.txt", size=1, sha256="0" * 64)],
+            total_files=1,
+            total_size=1,
+        )
+        (backup_dir / "backup_manifest.json").write_text(
+            json.dumps(manifest.model_dump(mode="json"), default=str)
+        )
+
+        calls = []
+
+        def spy_verify(path, verbose=False, manifest=None):
+            calls.append(manifest)
+            return False
+
+        monkeypatch.setattr("orca_backup.core.verify.verify_backup", spy_verify)
+
+        info = get_backup_info(backup_dir)
+        assert info.is_valid is None
+        assert calls == []
+
+        info = get_backup_info(backup_dir, verify=True)
+        assert info.is_valid is False
+        # The already-loaded manifest is reused
+        assert calls[0] == info.manifest
+
     def test_get_info_zip_backup(self, tmp_path):
         """Test getting info for ZIP backup."""
         staging_dir = tmp_path / "staging"